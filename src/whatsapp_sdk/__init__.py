@@ -7,8 +7,9 @@ from __future__ import annotations
 
 __version__ = "0.2.0"
 
-from .client import WhatsAppClient
-from .config import WhatsAppConfig
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from .exceptions import (
     WhatsAppAPIError,
     WhatsAppAuthenticationError,
@@ -21,23 +22,67 @@ from .exceptions import (
     WhatsAppWebhookError,
 )
 
-# Import all models for convenience
-from .models import (  # Base models; Webhook models
-    AudioMessage,
-    ContactMessage,
-    DocumentMessage,
-    ImageMessage,
-    InteractiveMessage,
-    LocationMessage,
-    MessageResponse,
-    TemplateMessage,
-    TextMessage,
-    VideoMessage,
-    WebhookEvent,
-    WebhookMessage,
-)
+if TYPE_CHECKING:
+    from .client import WhatsAppClient
+    from .config import WhatsAppConfig
+    from .models import (  # Base models; Webhook models
+        AudioMessage,
+        ContactMessage,
+        DocumentMessage,
+        ImageMessage,
+        InteractiveMessage,
+        LocationMessage,
+        MessageResponse,
+        TemplateMessage,
+        TextMessage,
+        VideoMessage,
+        WebhookEvent,
+        WebhookMessage,
+    )
+
+# Client, config and models pull in httpx and pydantic, so they are imported
+# on first attribute access (PEP 562) rather than with the package
+_LAZY_IMPORTS = {
+    "WhatsAppClient": ".client",
+    "WhatsAppConfig": ".config",
+    "AudioMessage": ".models",
+    "ContactMessage": ".models",
+    "DocumentMessage": ".models",
+    "ImageMessage": ".models",
+    "InteractiveMessage": ".models",
+    "LocationMessage": ".models",
+    "MessageResponse": ".models",
+    "TemplateMessage": ".models",
+    "TextMessage": ".models",
+    "VideoMessage": ".models",
+    "WebhookEvent": ".models",
+    "WebhookMessage": ".models",
+}
+
+# Submodules the package used to bind on import; still reachable as attributes
+_LAZY_SUBMODULES = frozenset({"client", "config", "http_client", "models", "services"})
+
+
+def __getattr__(name: str) -> Any:
+    """Import client, config and model classes, and submodules, on first access."""
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
 
-__all__ = [
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes including lazily imported names."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _LAZY_SUBMODULES)
+
+
+__all__ = (
     "AudioMessage",
     "ContactMessage",
     "DocumentMessage",
@@ -61,4 +106,4 @@ __all__ = [
     "WhatsAppTimeoutError",
     "WhatsAppValidationError",
     "WhatsAppWebhookError",
-]
+)
@@ -7,12 +7,15 @@ This client wires all services together and provides a clean entry point.
 from __future__ import annotations
 
 import os
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from .config import WhatsAppConfig
 from .http_client import HTTPClient
 from .services import MediaService, MessagesService, TemplatesService, WebhooksService
 
+if TYPE_CHECKING:
+    import httpx
+
 
 class WhatsAppClient:
     """Main WhatsApp Business API client.
@@ -39,8 +42,8 @@ class WhatsAppClient:
 
     def __init__(
         self,
-        phone_number_id: str,
-        access_token: str,
+        phone_number_id: Optional[str] = None,
+        access_token: Optional[str] = None,
         app_secret: Optional[str] = None,
         webhook_verify_token: Optional[str] = None,
         base_url: str = "https://graph.facebook.com",
@@ -48,12 +51,16 @@ class WhatsAppClient:
         timeout: int = 30,
         max_retries: int = 3,
         rate_limit: int = 80,
+        *,
+        httpx_client: Optional[httpx.Client] = None,
+        http_client: Optional[HTTPClient] = None,
     ):
         """Initialize WhatsApp client.
 
         Args:
-            phone_number_id: WhatsApp Business phone number ID
-            access_token: Meta access token
+            phone_number_id: WhatsApp Business phone number ID (optional when
+                http_client is given)
+            access_token: Meta access token (optional when http_client is given)
             app_secret: App secret for webhook signature validation
             webhook_verify_token: Token for webhook verification
             base_url: API base URL (defaults to Meta's URL)
@@ -61,25 +68,62 @@ class WhatsAppClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
             rate_limit: Requests per second limit
+            httpx_client: Optional httpx client (keyword-only) whose connection pool
+                is shared with other SDK clients; it is not closed by this client
+            http_client: Optional pre-built HTTPClient (keyword-only) to use instead
+                of creating one; every setting is taken from its ``config``, so the
+                connection settings above are ignored. Mutually exclusive with
+                httpx_client
+
+        Raises:
+            TypeError: If http_client is not an HTTPClient
+            ValueError: If phone_number_id or access_token is missing, if both
+                httpx_client and http_client are given, or if an explicitly passed
+                credential does not match http_client's config
         """
-        # Create configuration
-        self.config = WhatsAppConfig(
-            phone_number_id=phone_number_id,
-            access_token=access_token,
-            app_secret=app_secret,
-            webhook_verify_token=webhook_verify_token,
-            base_url=base_url,
-            api_version=api_version,
-            timeout=timeout,
-            max_retries=max_retries,
-            rate_limit=rate_limit,
-        )
+        if http_client is not None:
+            if not isinstance(http_client, HTTPClient):
+                raise TypeError(
+                    f"http_client must be an HTTPClient, got {type(http_client).__name__}"
+                )
+            if httpx_client is not None:
+                raise ValueError("Pass either httpx_client or http_client, not both")
+
+            # Use the injected client's configuration so both stay in sync
+            self.config = http_client.config
+            self.http_client = http_client
+
+            # Explicit credentials must agree with the injected configuration
+            for name, value in (
+                ("phone_number_id", phone_number_id),
+                ("access_token", access_token),
+                ("app_secret", app_secret),
+                ("webhook_verify_token", webhook_verify_token),
+            ):
+                if value is not None and value != getattr(self.config, name):
+                    raise ValueError(f"{name} does not match http_client.config")
+        else:
+            if phone_number_id is None or access_token is None:
+                raise ValueError("phone_number_id and access_token are required")
+
+            # Create configuration
+            self.config = WhatsAppConfig(
+                phone_number_id=phone_number_id,
+                access_token=access_token,
+                app_secret=app_secret,
+                webhook_verify_token=webhook_verify_token,
+                base_url=base_url,
+                api_version=api_version,
+                timeout=timeout,
+                max_retries=max_retries,
+                rate_limit=rate_limit,
+            )
+
+            # Initialize HTTP client
+            self.http_client = HTTPClient(self.config, client=httpx_client)
 
         # Store phone number ID for services
-        self.phone_number_id = phone_number_id
-
-        # Initialize HTTP client
-        self.http_client = HTTPClient(self.config)
+        self.phone_number_id = self.config.phone_number_id
 
         # Initialize services
         self._init_services()
@@ -135,24 +179,33 @@ class WhatsAppClient:
             # Create client
             client = WhatsAppClient.from_env()
         """
-        phone_number_id = os.environ.get("WHATSAPP_PHONE_NUMBER_ID")
-        access_token = os.environ.get("WHATSAPP_ACCESS_TOKEN")
+        # Bind the lookup once; os.environ is re-read on every call so that
+        # values changed at runtime (dotenv, test monkeypatching) are honored
+        getenv = os.environ.get
+
+        phone_number_id = getenv("WHATSAPP_PHONE_NUMBER_ID")
+        access_token = getenv("WHATSAPP_ACCESS_TOKEN")
 
         if not phone_number_id:
             raise ValueError("WHATSAPP_PHONE_NUMBER_ID environment variable is required")
         if not access_token:
             raise ValueError("WHATSAPP_ACCESS_TOKEN environment variable is required")
 
+        # Only parse integers that are actually set; defaults are used as-is
+        timeout = getenv("WHATSAPP_TIMEOUT")
+        max_retries = getenv("WHATSAPP_MAX_RETRIES")
+        rate_limit = getenv("WHATSAPP_RATE_LIMIT")
+
         return cls(
             phone_number_id=phone_number_id,
             access_token=access_token,
-            app_secret=os.environ.get("WHATSAPP_APP_SECRET"),
-            webhook_verify_token=os.environ.get("WHATSAPP_WEBHOOK_VERIFY_TOKEN"),
-            base_url=os.environ.get("WHATSAPP_BASE_URL") or "https://graph.facebook.com",
-            api_version=os.environ.get("WHATSAPP_API_VERSION") or "v18.0",
-            timeout=int(os.environ.get("WHATSAPP_TIMEOUT", "30")),
-            max_retries=int(os.environ.get("WHATSAPP_MAX_RETRIES", "3")),
-            rate_limit=int(os.environ.get("WHATSAPP_RATE_LIMIT", "80")),
+            app_secret=getenv("WHATSAPP_APP_SECRET"),
+            webhook_verify_token=getenv("WHATSAPP_WEBHOOK_VERIFY_TOKEN"),
+            base_url=getenv("WHATSAPP_BASE_URL") or "https://graph.facebook.com",
+            api_version=getenv("WHATSAPP_API_VERSION") or "v18.0",
+            timeout=int(timeout) if timeout else 30,
+            max_retries=int(max_retries) if max_retries else 3,
+            rate_limit=int(rate_limit) if rate_limit else 80,
         )
 
     def __repr__(self) -> str:
@@ -7,15 +7,18 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class WhatsAppConfig(BaseModel):
     """Configuration for WhatsApp SDK.
 
     Contains all settings needed to interact with the WhatsApp Business API.
+    Instances are immutable; services read their settings once at startup.
     """
 
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     phone_number_id: str = Field(..., description="WhatsApp Business phone number ID")
     access_token: str = Field(..., description="Meta access token for API authentication")
     app_secret: Optional[str] = Field(
@@ -27,8 +30,3 @@ class WhatsAppConfig(BaseModel):
     timeout: int = Field(30, gt=0, description="Request timeout in seconds")
     max_retries: int = Field(3, ge=0, description="Maximum number of retries for failed requests")
     rate_limit: int = Field(80, gt=0, description="Maximum requests per second")
-
-    class Config:
-        """Pydantic config."""
-
-        validate_assignment = True
@@ -6,15 +6,21 @@ including retries, rate limiting, and error handling.
 
 from __future__ import annotations
 
+import json as _json
+import random
 import time
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 from .exceptions import (
     WhatsAppAPIError,
     WhatsAppAuthenticationError,
-    WhatsAppError,
     WhatsAppRateLimitError,
     WhatsAppValidationError,
 )
@@ -22,6 +28,16 @@ from .exceptions import (
 if TYPE_CHECKING:
     from .config import WhatsAppConfig
 
+# Use orjson for response parsing when installed (pip install whatsapp-sdk[speedups])
+_json_loads = orjson.loads if orjson is not None else _json.loads
+
+# Chunk size for streamed downloads
+_STREAM_CHUNK_SIZE = 1 << 20
+
+# Retry backoff in seconds: base delay doubled per attempt, capped
+_BACKOFF_BASE = 0.5
+_BACKOFF_CAP = 8.0
+
 
 class HTTPClient:
     """Synchronous HTTP client for WhatsApp API requests.
@@ -33,28 +49,37 @@ class HTTPClient:
     - Authentication
     """
 
-    def __init__(self, config: WhatsAppConfig):
+    def __init__(self, config: WhatsAppConfig, client: Optional[httpx.Client] = None):
         """Initialize HTTP client.
 
         Args:
             config: WhatsApp configuration
+            client: Optional httpx client to share a connection pool between
+                SDK clients (e.g. one per access token). A shared client is
+                not closed by ``close()``.
         """
         self.config = config
         self.base_url = f"{config.base_url}/{config.api_version}"
 
-        # Create httpx client with default headers
-        self.client = httpx.Client(
-            timeout=config.timeout,
-            headers={
-                "Authorization": f"Bearer {config.access_token}",
-                "Content-Type": "application/json",
-                "User-Agent": "WhatsApp-sdk/0.1.0",
-            },
-        )
+        # Headers are sent per request so a shared httpx client can serve
+        # several access tokens. Content-Type is left to httpx so JSON and
+        # multipart bodies each get the correct value.
+        self._headers = {
+            "Authorization": f"Bearer {config.access_token}",
+            "User-Agent": "WhatsApp-sdk/0.1.0",
+        }
+
+        # Settings read on every request; config is immutable so cache them
+        self._timeout = config.timeout
+        self._max_retries = config.max_retries
+
+        self._owns_client = client is None
+        self.client = client if client is not None else httpx.Client(timeout=config.timeout)
 
-        # Rate limiting
-        self._last_request_time: float = 0
-        self._request_interval = 1.0 / config.rate_limit  # Seconds between requests
+        # Rate limiting (token bucket refilled at rate_limit tokens per second)
+        self._rate = float(config.rate_limit)
+        self._tokens = self._rate
+        self._last_refill = time.monotonic()
 
     def post(
         self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs: Any
@@ -74,41 +99,17 @@ class HTTPClient:
             WhatsAppRateLimitError: For rate limit errors
             WhatsAppAuthenticationError: For auth errors
         """
-        # Handle rate limiting
-        self._apply_rate_limit()
-
-        # Build full URL if endpoint is relative
-        url = f"{self.base_url}/{endpoint}" if not endpoint.startswith("http") else endpoint
-
-        # Retry logic
-        last_error = None
-        for attempt in range(self.config.max_retries + 1):
-            try:
-                response = self.client.post(url, json=json, **kwargs)
-                return self._handle_response(response)
-            except WhatsAppRateLimitError:
-                # For rate limit errors, wait longer
-                if attempt < self.config.max_retries:
-                    time.sleep(2**attempt)  # Exponential backoff
-                    continue
-                raise
-            except WhatsAppError as e:
-                last_error = e
-                if attempt < self.config.max_retries:
-                    time.sleep(0.5 * (attempt + 1))  # Linear backoff
-                    continue
-                raise
-            except httpx.HTTPError as e:
-                last_error = WhatsAppAPIError(f"HTTP error: {e!s}")
-                if attempt < self.config.max_retries:
-                    time.sleep(0.5 * (attempt + 1))
-                    continue
-                raise last_error from None
+        # Serialize the payload up front with orjson when available
+        if json is not None and orjson is not None:
+            kwargs["content"] = orjson.dumps(json)
+            kwargs["headers"] = {
+                "Content-Type": "application/json",
+                **(kwargs.get("headers") or {}),
+            }
+            json = None
 
-        # Should not reach here, but just in case
-        if last_error:
-            raise last_error
-        raise WhatsAppAPIError("Unknown error occurred")
+        response = self._request("POST", endpoint, json=json, **kwargs)
+        return self._handle_response(response)
 
     def get(
         self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any
@@ -123,34 +124,8 @@ class HTTPClient:
         Returns:
             Response data as dictionary
         """
-        # Handle rate limiting
-        self._apply_rate_limit()
-
-        # Build full URL if endpoint is relative
-        url = f"{self.base_url}/{endpoint}" if not endpoint.startswith("http") else endpoint
-
-        # Retry logic
-        last_error = None
-        for attempt in range(self.config.max_retries + 1):
-            try:
-                response = self.client.get(url, params=params, **kwargs)
-                return self._handle_response(response)
-            except WhatsAppError as e:
-                last_error = e
-                if attempt < self.config.max_retries:
-                    time.sleep(0.5 * (attempt + 1))
-                    continue
-                raise
-            except httpx.HTTPError as e:
-                last_error = WhatsAppAPIError(f"HTTP error: {e!s}")
-                if attempt < self.config.max_retries:
-                    time.sleep(0.5 * (attempt + 1))
-                    continue
-                raise last_error from None
-
-        if last_error:
-            raise last_error
-        raise WhatsAppAPIError("Unknown error occurred")
+        response = self._request("GET", endpoint, params=params, **kwargs)
+        return self._handle_response(response)
 
     def delete(self, endpoint: str, **kwargs: Any) -> Dict[str, Any]:
         """Make DELETE request to WhatsApp API.
@@ -162,34 +137,8 @@ class HTTPClient:
         Returns:
             Response data as dictionary
         """
-        # Handle rate limiting
-        self._apply_rate_limit()
-
-        # Build full URL if endpoint is relative
-        url = f"{self.base_url}/{endpoint}" if not endpoint.startswith("http") else endpoint
-
-        # Retry logic
-        last_error = None
-        for attempt in range(self.config.max_retries + 1):
-            try:
-                response = self.client.delete(url, **kwargs)
-                return self._handle_response(response)
-            except WhatsAppError as e:
-                last_error = e
-                if attempt < self.config.max_retries:
-                    time.sleep(0.5 * (attempt + 1))
-                    continue
-                raise
-            except httpx.HTTPError as e:
-                last_error = WhatsAppAPIError(f"HTTP error: {e!s}")
-                if attempt < self.config.max_retries:
-                    time.sleep(0.5 * (attempt + 1))
-                    continue
-                raise last_error from None
-
-        if last_error:
-            raise last_error
-        raise WhatsAppAPIError("Unknown error occurred")
+        response = self._request("DELETE", endpoint, **kwargs)
+        return self._handle_response(response)
 
     def upload_multipart(
         self,
@@ -214,98 +163,140 @@ class HTTPClient:
             WhatsAppRateLimitError: For rate limit errors
             WhatsAppAuthenticationError: For auth errors
         """
-        # Handle rate limiting
-        self._apply_rate_limit()
+        response = self._request("POST", endpoint, files=files, data=data, **kwargs)
+        return self._handle_response(response)
 
-        # Build full URL if endpoint is relative
-        url = f"{self.base_url}/{endpoint}" if not endpoint.startswith("http") else endpoint
+    def download_binary(self, url: str, **kwargs: Any) -> bytes:
+        """Download binary content from a URL.
+
+        Args:
+            url: Full URL to download from
+            **kwargs: Additional httpx request parameters
+
+        Returns:
+            Binary content as bytes
+
+        Raises:
+            WhatsAppAPIError: For API errors
+        """
+        response = self._request("GET", url, **kwargs)
+
+        # Handle non-200 status codes
+        if response.status_code >= 400:
+            raise WhatsAppAPIError(f"Download failed: {response.status_code}")
+
+        content: bytes = response.content
+        return content
+
+    def stream_binary(
+        self, url: str, chunk_size: int = _STREAM_CHUNK_SIZE, **kwargs: Any
+    ) -> Iterator[bytes]:
+        """Stream binary content from a URL in chunks.
 
-        # For multipart uploads, we need to temporarily remove Content-Type header
-        # so httpx can set it correctly with boundary
-        temp_headers = self.client.headers.copy()
-        if "content-type" in temp_headers:
-            del temp_headers["content-type"]
+        Unlike ``download_binary`` the body is never held in memory as a
+        whole. Network failures, rate limits and server errors are retried
+        like ``_request`` until the first chunk is yielded; failures after
+        that are not, since chunks may already have been consumed.
 
-        # Retry logic
-        last_error = None
-        for attempt in range(self.config.max_retries + 1):
+        Args:
+            url: Full URL to download from
+            chunk_size: Maximum size of each yielded chunk in bytes
+            **kwargs: Additional httpx request parameters
+
+        Yields:
+            Chunks of the response body
+
+        Raises:
+            WhatsAppAPIError: For API errors or network failures
+            WhatsAppRateLimitError: For rate limit errors
+            WhatsAppAuthenticationError: For auth errors
+        """
+        url = self._prepare_request(url, kwargs)
+
+        max_retries = self._max_retries
+        attempt = 0
+        started = False
+        while True:
             try:
-                response = self.client.post(
-                    url,
-                    files=files,
-                    data=data,
-                    headers=temp_headers,
-                    **kwargs
-                )
-                return self._handle_response(response)
-            except WhatsAppRateLimitError:
-                # For rate limit errors, wait longer
-                if attempt < self.config.max_retries:
-                    time.sleep(2**attempt)  # Exponential backoff
-                    continue
-                raise
-            except WhatsAppError as e:
-                last_error = e
-                if attempt < self.config.max_retries:
-                    time.sleep(0.5 * (attempt + 1))  # Linear backoff
-                    continue
-                raise
+                with self.client.stream("GET", url, **kwargs) as response:
+                    status = response.status_code
+                    if status < 400:
+                        started = True
+                        yield from response.iter_bytes(chunk_size)
+                        return
+                    if attempt >= max_retries or (status != 429 and status < 500):
+                        response.read()
+                        self._handle_response(response)
             except httpx.HTTPError as e:
-                last_error = WhatsAppAPIError(f"HTTP error: {e!s}")
-                if attempt < self.config.max_retries:
-                    time.sleep(0.5 * (attempt + 1))
-                    continue
-                raise last_error from None
+                if started or attempt >= max_retries:
+                    raise WhatsAppAPIError(f"HTTP error: {e!s}") from None
 
-        # Should not reach here, but just in case
-        if last_error:
-            raise last_error
-        raise WhatsAppAPIError("Unknown error occurred")
+            self._backoff(attempt)
+            attempt += 1
 
-    def download_binary(self, url: str, **kwargs: Any) -> bytes:
-        """Download binary content from a URL.
+    def _request(self, method: str, endpoint: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, retrying rate limits, server errors and network failures.
+
+        Client errors (4xx other than 429) are returned immediately since
+        repeating the same request cannot succeed.
 
         Args:
-            url: Full URL to download from
+            method: HTTP method
+            endpoint: API endpoint (can be relative or absolute)
             **kwargs: Additional httpx request parameters
 
         Returns:
-            Binary content as bytes
+            Final HTTP response
 
         Raises:
-            WhatsAppAPIError: For API errors
+            WhatsAppAPIError: If the request fails at the network level
         """
-        # Handle rate limiting
-        self._apply_rate_limit()
+        url = self._prepare_request(endpoint, kwargs)
 
-        # Retry logic
-        last_error = None
-        for attempt in range(self.config.max_retries + 1):
+        max_retries = self._max_retries
+        attempt = 0
+        while True:
             try:
-                response = self.client.get(url, **kwargs)
-
-                # Handle non-200 status codes
-                if response.status_code >= 400:
-                    raise WhatsAppAPIError(f"Download failed: {response.status_code}")
-
-                content: bytes = response.content
-                return content
-            except WhatsAppError as e:
-                last_error = e
-                if attempt < self.config.max_retries:
-                    time.sleep(0.5 * (attempt + 1))
-                    continue
-                raise
+                response = self.client.request(method, url, **kwargs)
             except httpx.HTTPError as e:
-                last_error = WhatsAppAPIError(f"HTTP error: {e!s}")
-                if attempt < self.config.max_retries:
-                    time.sleep(0.5 * (attempt + 1))
-                    continue
-                raise last_error from None
+                if attempt >= max_retries:
+                    raise WhatsAppAPIError(f"HTTP error: {e!s}") from None
+            else:
+                status = response.status_code
+                if attempt >= max_retries or (status != 429 and status < 500):
+                    return response
+
+            self._backoff(attempt)
+            attempt += 1
+
+    @staticmethod
+    def _backoff(attempt: int) -> None:
+        """Sleep before retry number ``attempt + 1``.
+
+        Exponential backoff with full jitter so clients retrying the same
+        outage do not wake up in lockstep.
+        """
+        time.sleep(random.random() * min(_BACKOFF_CAP, _BACKOFF_BASE * 2**attempt))
 
-        if last_error:
-            raise last_error
-        raise WhatsAppAPIError("Unknown error occurred")
+    def _prepare_request(self, endpoint: str, kwargs: Dict[str, Any]) -> str:
+        """Apply rate limiting and fill in default request parameters.
+
+        Args:
+            endpoint: API endpoint (can be relative or absolute)
+            kwargs: httpx request parameters, updated in place
+
+        Returns:
+            Absolute request URL
+        """
+        # Handle rate limiting
+        self._apply_rate_limit()
+
+        headers = kwargs.pop("headers", None)
+        kwargs["headers"] = {**self._headers, **headers} if headers else self._headers
+        kwargs.setdefault("timeout", self._timeout)
+
+        # Build full URL if endpoint is relative
+        return f"{self.base_url}/{endpoint}" if not endpoint.startswith("http") else endpoint
 
     def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
         """Handle API response and errors.
@@ -319,57 +310,81 @@ class HTTPClient:
         Raises:
             Various WhatsAppError subclasses based on error type
         """
-        # Check status code
-        if response.status_code == 429:
+        status = response.status_code
+
+        # Parse successful response
+        if status < 400:
+            # Some endpoints return empty responses
+            if status == 204:
+                return {"success": True}
+            try:
+                data: Dict[str, Any] = _json_loads(response.content)
+                return data
+            except ValueError:
+                raise WhatsAppAPIError("Invalid JSON response") from None
+
+        if status == 429:
             raise WhatsAppRateLimitError("Rate limit exceeded")
 
-        if response.status_code == 401:
+        if status == 401:
             raise WhatsAppAuthenticationError("Invalid access token")
 
-        if response.status_code == 400:
-            # Parse error details
-            try:
-                error_data = response.json()
-                error = error_data.get("error", {})
-                message = error.get("message", "Validation error")
-                raise WhatsAppValidationError(message)
-            except (ValueError, KeyError):
-                raise WhatsAppValidationError("Bad request") from None
+        # Parse error details once
+        error = self._parse_error(response)
 
-        if response.status_code >= 400:
-            # General API error
-            try:
-                error_data = response.json()
-                error = error_data.get("error", {})
-                message = error.get("message", f"HTTP {response.status_code}")
-                code = error.get("code", response.status_code)
-                raise WhatsAppAPIError(f"Error {code}: {message}")
-            except (ValueError, KeyError):
-                raise WhatsAppAPIError(f"HTTP {response.status_code}") from None
+        if status == 400:
+            if error is None:
+                raise WhatsAppValidationError("Bad request")
+            raise WhatsAppValidationError(error.get("message", "Validation error"))
 
-        # Parse successful response
+        # General API error
+        if error is None:
+            raise WhatsAppAPIError(f"HTTP {status}")
+        message = error.get("message", f"HTTP {status}")
+        code = error.get("code", status)
+        raise WhatsAppAPIError(f"Error {code}: {message}")
+
+    @staticmethod
+    def _parse_error(response: httpx.Response) -> Optional[Dict[str, Any]]:
+        """Extract the error object from an error response body.
+
+        Args:
+            response: HTTP error response
+
+        Returns:
+            Error details, or None if the body is not a JSON object
+        """
         try:
-            data: Dict[str, Any] = response.json()
-            return data
+            error_data = _json_loads(response.content)
         except ValueError:
-            # Some endpoints return empty responses
-            if response.status_code == 204:
-                return {"success": True}
-            raise WhatsAppAPIError("Invalid JSON response") from None
+            return None
+        if not isinstance(error_data, dict):
+            return None
+        error = error_data.get("error", {})
+        return error if isinstance(error, dict) else {}
 
     def _apply_rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
+        """Apply rate limiting between requests.
+
+        Requests proceed immediately while tokens are available, allowing
+        bursts of up to ``rate_limit`` requests; only an empty bucket sleeps.
+        """
+        now = time.monotonic()
+        tokens = min(self._rate, self._tokens + (now - self._last_refill) * self._rate)
 
-        if time_since_last < self._request_interval:
-            time.sleep(self._request_interval - time_since_last)
+        if tokens < 1:
+            wait = (1 - tokens) / self._rate
+            time.sleep(wait)
+            now += wait
+            tokens = 1.0
 
-        self._last_request_time = time.time()
+        self._tokens = tokens - 1
+        self._last_refill = now
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self.client.close()
+        """Close the HTTP client unless it was provided by the caller."""
+        if self._owns_client:
+            self.client.close()
 
     def __enter__(self) -> HTTPClient:
         """Context manager entry."""
@@ -36,6 +36,7 @@ from .media import (
 from .messages import (  # Media messages; Interactive; Location; Status; Reaction; Template; Text message
     AudioMessage,
     Button,
+    ButtonReply,
     DocumentMessage,
     ImageMessage,
     InteractiveAction,
@@ -47,6 +48,7 @@ from .messages import (  # Media messages; Interactive; Location; Status; Reacti
     MessageStatus,
     ReactionMessage,
     Section,
+    SectionRow,
     StickerMessage,
     TemplateComponent,
     TemplateLanguage,
@@ -90,11 +92,12 @@ from .webhooks import (  # Message types
     WebhookVideoMessage,
 )
 
-__all__ = [
+__all__ = (
     "Address",
     "AudioMessage",
     "BaseResponse",
     "Button",
+    "ButtonReply",
     "Contact",
     "ContactMessage",
     "DocumentMessage",
@@ -125,6 +128,7 @@ __all__ = [
     "ReceivedContact",
     "ResumableUploadSession",
     "Section",
+    "SectionRow",
     "StickerMessage",
     "SupportedMediaTypes",
     "Template",
@@ -163,4 +167,4 @@ __all__ = [
     "WebhookValue",
     "WebhookVerification",
     "WebhookVideoMessage",
-]
+)
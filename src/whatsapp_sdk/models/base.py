@@ -8,7 +8,10 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Shared by response models: keep additional fields returned by the API
+_RESPONSE_CONFIG = ConfigDict(extra="allow")
 
 
 class BaseResponse(BaseModel):
@@ -21,8 +24,7 @@ class BaseResponse(BaseModel):
         default="whatsapp", description="The messaging product (always 'whatsapp')"
     )
 
-    class Config:
-        extra = "allow"  # Allow additional fields from API
+    model_config = _RESPONSE_CONFIG
 
 
 class Contact(BaseModel):
@@ -34,8 +36,7 @@ class Contact(BaseModel):
     input: str = Field(..., description="The phone number input originally provided")
     wa_id: str = Field(..., description="The WhatsApp ID of the contact (formatted phone number)")
 
-    class Config:
-        extra = "allow"
+    model_config = _RESPONSE_CONFIG
 
 
 class Message(BaseModel):
@@ -46,8 +47,7 @@ class Message(BaseModel):
 
     id: str = Field(..., description="The unique message ID from WhatsApp")
 
-    class Config:
-        extra = "allow"
+    model_config = _RESPONSE_CONFIG
 
 
 class Error(BaseModel):
@@ -65,8 +65,7 @@ class Error(BaseModel):
     error_user_msg: Optional[str] = Field(None, description="User-friendly error message")
     fbtrace_id: Optional[str] = Field(None, description="Facebook trace ID for debugging")
 
-    class Config:
-        extra = "allow"
+    model_config = _RESPONSE_CONFIG
 
 
 class ErrorResponse(BaseModel):
@@ -74,8 +73,7 @@ class ErrorResponse(BaseModel):
 
     error: Error = Field(..., description="The error details")
 
-    class Config:
-        extra = "allow"
+    model_config = _RESPONSE_CONFIG
 
 
 class MessageResponse(BaseResponse):
@@ -91,9 +89,6 @@ class MessageResponse(BaseResponse):
         default_factory=list, description="List of messages that were sent"
     )
 
-    class Config:
-        extra = "allow"
-
 
 class PaginationCursor(BaseModel):
     """Pagination cursor for list responses."""
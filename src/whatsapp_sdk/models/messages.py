@@ -32,7 +32,19 @@ class TextMessage(BaseModel):
 # ============================================================================
 
 
-class ImageMessage(BaseModel):
+class _MediaMessage(BaseModel):
+    """Shared validation for media sent via media ID or URL."""
+
+    @field_validator("link", check_fields=False)
+    @classmethod
+    def validate_media_source(cls, v: Optional[str], info: Any) -> Optional[str]:
+        """Ensure either id or link is provided, not both."""
+        if v and info.data.get("id"):
+            raise ValueError("Provide either 'id' or 'link', not both")
+        return v
+
+
+class ImageMessage(_MediaMessage):
     """Image message request model.
 
     Send images via media ID or URL.
@@ -44,16 +56,8 @@ class ImageMessage(BaseModel):
         None, max_length=1024, description="Optional caption for the image (max 1024 chars)"
     )
 
-    @field_validator("id", "link")
-    @classmethod
-    def validate_media_source(cls, v: Optional[str], info: Any) -> Optional[str]:
-        """Ensure either id or link is provided, not both."""
-        if info.field_name == "link" and v and info.data.get("id"):
-            raise ValueError("Provide either 'id' or 'link', not both")
-        return v
-
 
-class DocumentMessage(BaseModel):
+class DocumentMessage(_MediaMessage):
     """Document message request model.
 
     Send documents/files via media ID or URL.
@@ -68,16 +72,8 @@ class DocumentMessage(BaseModel):
         None, description="Filename to display (required when using link)"
     )
 
-    @field_validator("id", "link")
-    @classmethod
-    def validate_media_source(cls, v: Optional[str], info: Any) -> Optional[str]:
-        """Ensure either id or link is provided, not both."""
-        if info.field_name == "link" and v and info.data.get("id"):
-            raise ValueError("Provide either 'id' or 'link', not both")
-        return v
-
 
-class AudioMessage(BaseModel):
+class AudioMessage(_MediaMessage):
     """Audio message request model.
 
     Send audio files via media ID or URL.
@@ -86,16 +82,8 @@ class AudioMessage(BaseModel):
     id: Optional[str] = Field(None, description="Media ID from uploaded audio")
     link: Optional[str] = Field(None, description="URL of the audio file (HTTPS only)")
 
-    @field_validator("id", "link")
-    @classmethod
-    def validate_media_source(cls, v: Optional[str], info: Any) -> Optional[str]:
-        """Ensure either id or link is provided, not both."""
-        if info.field_name == "link" and v and info.data.get("id"):
-            raise ValueError("Provide either 'id' or 'link', not both")
-        return v
-
 
-class VideoMessage(BaseModel):
+class VideoMessage(_MediaMessage):
     """Video message request model.
 
     Send videos via media ID or URL.
@@ -107,16 +95,8 @@ class VideoMessage(BaseModel):
         None, max_length=1024, description="Optional caption for the video (max 1024 chars)"
     )
 
-    @field_validator("id", "link")
-    @classmethod
-    def validate_media_source(cls, v: Optional[str], info: Any) -> Optional[str]:
-        """Ensure either id or link is provided, not both."""
-        if info.field_name == "link" and v and info.data.get("id"):
-            raise ValueError("Provide either 'id' or 'link', not both")
-        return v
-
 
-class StickerMessage(BaseModel):
+class StickerMessage(_MediaMessage):
     """Sticker message request model.
 
     Send stickers via media ID or URL.
@@ -127,14 +107,6 @@ class StickerMessage(BaseModel):
         None, description="URL of the sticker file (HTTPS only, WebP format)"
     )
 
-    @field_validator("id", "link")
-    @classmethod
-    def validate_media_source(cls, v: Optional[str], info: Any) -> Optional[str]:
-        """Ensure either id or link is provided, not both."""
-        if info.field_name == "link" and v and info.data.get("id"):
-            raise ValueError("Provide either 'id' or 'link', not both")
-        return v
-
 
 # ============================================================================
 # LOCATION MESSAGE MODEL
@@ -186,18 +158,35 @@ class InteractiveFooter(BaseModel):
     text: str = Field(..., max_length=60, description="Footer text (max 60 chars)")
 
 
+class ButtonReply(BaseModel):
+    """Reply button identifier and label."""
+
+    id: str = Field(..., max_length=256, description="Button ID returned on click (max 256 chars)")
+    title: str = Field(..., max_length=20, description="Button label (max 20 chars)")
+
+
 class Button(BaseModel):
     """Button for interactive messages."""
 
     type: str = Field("reply", description="Button type (reply)")
-    reply: Dict[str, str] = Field(..., description="Reply button with 'id' and 'title'")
+    reply: ButtonReply = Field(..., description="Reply button with 'id' and 'title'")
+
+
+class SectionRow(BaseModel):
+    """Row in a list message section."""
+
+    id: str = Field(..., max_length=200, description="Row ID returned on selection (max 200 chars)")
+    title: str = Field(..., max_length=24, description="Row title (max 24 chars)")
+    description: Optional[str] = Field(
+        None, max_length=72, description="Optional row description (max 72 chars)"
+    )
 
 
 class Section(BaseModel):
     """Section for list messages."""
 
     title: Optional[str] = Field(None, max_length=24, description="Section title (max 24 chars)")
-    rows: List[Dict[str, str]] = Field(
+    rows: List[SectionRow] = Field(
         ..., description="List of rows with 'id', 'title', and optional 'description'"
     )
 
@@ -10,9 +10,9 @@ from .messages import MessagesService
 from .templates import TemplatesService
 from .webhooks import WebhooksService
 
-__all__ = [
+__all__ = (
     "MediaService",
     "MessagesService",
     "TemplatesService",
     "WebhooksService",
-]
+)
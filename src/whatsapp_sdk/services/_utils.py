@@ -0,0 +1,30 @@
+"""Helpers shared by the service modules."""
+
+from __future__ import annotations
+
+import re
+
+# Matches runs of non-digit characters stripped from phone numbers
+_NON_DIGIT_RE = re.compile(r"\D+")
+
+
+def format_phone_number(phone: str) -> str:
+    """Format phone number for WhatsApp API.
+
+    Args:
+        phone: Phone number in any format
+
+    Returns:
+        Formatted phone number (digits only)
+
+    Raises:
+        ValueError: If the number does not have 7-15 digits
+    """
+    # Remove all non-digit characters
+    formatted = _NON_DIGIT_RE.sub("", phone)
+
+    # Validate length (7-15 digits per WhatsApp requirements)
+    if not 7 <= len(formatted) <= 15:
+        raise ValueError(f"Invalid phone number length: {formatted}")
+
+    return formatted
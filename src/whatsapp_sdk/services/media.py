@@ -7,16 +7,49 @@ of images, videos, documents, and audio files.
 from __future__ import annotations
 
 import mimetypes
+import os
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Tuple
 
-from whatsapp_sdk.exceptions import WhatsAppMediaError
-from whatsapp_sdk.models import MediaDeleteResponse, MediaUploadResponse, MediaURLResponse
+from whatsapp_sdk.exceptions import WhatsAppError, WhatsAppMediaError
+from whatsapp_sdk.models import MediaUploadResponse, MediaURLResponse
 
 if TYPE_CHECKING:
     from whatsapp_sdk.config import WhatsAppConfig
     from whatsapp_sdk.http_client import HTTPClient
 
+# Size limits in bytes as (media type, limit), keyed by exact MIME type or
+# "type/" prefix
+_SIZE_LIMITS: Mapping[str, Tuple[str, int]] = MappingProxyType(
+    {
+        "image/webp": ("sticker", 512 * 1024),  # 512KB
+        "image/": ("image", 5 * 1024 * 1024),  # 5MB
+        "video/": ("video", 16 * 1024 * 1024),  # 16MB
+        "audio/": ("audio", 16 * 1024 * 1024),  # 16MB
+    }
+)
+_DOCUMENT_LIMIT = ("document", 100 * 1024 * 1024)  # 100MB
+# Files no larger than this fit every media type
+_MIN_SIZE_LIMIT = min(limit for _, limit in (*_SIZE_LIMITS.values(), _DOCUMENT_LIMIT))
+
+# Download URLs expire after 5 minutes; reuse them for a little less than that
+_URL_CACHE_TTL = 240.0
+_URL_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=256)
+def _guess_mime_type(filename: str) -> Optional[str]:
+    """Guess a MIME type from a lowercased file name such as "photo.jpg".
+
+    Keyed on the whole name rather than the last extension so compound
+    suffixes like ".tar.gz" resolve as ``mimetypes`` would.
+    """
+    return mimetypes.guess_type(filename)[0]
+
 
 class MediaService:
     """Service for managing WhatsApp media.
@@ -37,6 +70,10 @@ class MediaService:
         self.phone_number_id = phone_number_id
         # Use HTTPClient's properly constructed base_url that includes v23.0
         self.base_url = f"{http_client.base_url}/{phone_number_id}/media"
+        # media_id -> (download URL, monotonic expiry time)
+        self._url_cache: Dict[str, Tuple[str, float]] = {}
+        # Services may be shared between threads; guards _url_cache updates
+        self._url_cache_lock = threading.Lock()
 
     # ========================================================================
     # UPLOAD MEDIA
@@ -66,35 +103,32 @@ class MediaService:
                 mime_type="application/pdf"
             )
         """
-        file_path_obj = Path(file_path)
-
-        # Check if file exists
-        if not file_path_obj.exists():
-            raise WhatsAppMediaError(f"File not found: {file_path}")
+        # Open first: a missing file surfaces here, without a separate exists() check
+        try:
+            file = open(file_path, "rb")  # noqa: SIM115 - closed by the with below
+        except FileNotFoundError:
+            raise WhatsAppMediaError(f"File not found: {file_path}") from None
 
-        # Auto-detect MIME type if not provided
-        if not mime_type:
-            mime_type, _ = mimetypes.guess_type(str(file_path_obj))
+        with file:
+            # Auto-detect MIME type if not provided
             if not mime_type:
-                raise WhatsAppMediaError(f"Could not determine MIME type for: {file_path}")
+                mime_type = _guess_mime_type(os.path.basename(file_path).lower())
+                if not mime_type:
+                    raise WhatsAppMediaError(f"Could not determine MIME type for: {file_path}")
 
-        # Validate file size based on media type
-        file_size = file_path_obj.stat().st_size
-        self._validate_file_size(mime_type, file_size)
+            # Validate file size based on media type (fstat on the open fd)
+            self._validate_file_size(mime_type, os.fstat(file.fileno()).st_size)
 
-        # Prepare file for upload
-        with open(file_path_obj, "rb") as file:
-            files = {"file": (file_path_obj.name, file, mime_type)}
+            # Prepare file for upload
+            files = {"file": (os.path.basename(file_path), file, mime_type)}
             data = {"messaging_product": "whatsapp", "type": mime_type}
 
             # Use HTTPClient's multipart upload method with proper error handling and retries
             result = self.http_client.upload_multipart(
-                f"{self.phone_number_id}/media",
-                files=files,
-                data=data
+                f"{self.phone_number_id}/media", files=files, data=data
             )
 
-        return MediaUploadResponse(**result)
+        return MediaUploadResponse.model_validate(result)
 
     def upload_from_bytes(
         self, file_bytes: bytes, mime_type: str, filename: str
@@ -148,7 +182,7 @@ class MediaService:
             data=data
         )
 
-        return MediaUploadResponse(**result)
+        return MediaUploadResponse.model_validate(result)
 
     # ========================================================================
     # DOWNLOAD MEDIA
@@ -175,7 +209,7 @@ class MediaService:
             content = response.content
         """
         response = self.http_client.get(f"{media_id}")
-        media_info = MediaURLResponse(**response)
+        media_info = MediaURLResponse.model_validate(response)
         return media_info.url
 
     def download(self, media_id: str) -> bytes:
@@ -196,7 +230,7 @@ class MediaService:
                 f.write(content)
         """
         # First get the URL
-        url = self.get_url(media_id)
+        url = self._download_url(media_id)
 
         # Download the file using HTTPClient's binary download method
         # Note: The media URL requires authentication which HTTPClient handles
@@ -204,10 +238,11 @@ class MediaService:
             content = self.http_client.download_binary(url)
             return content
         except Exception as e:
+            self._forget_url(media_id)
             raise WhatsAppMediaError(f"Download failed: {e}") from e
 
     def download_to_file(self, media_id: str, file_path: str) -> str:
-        """Download media directly to a file.
+        """Download media directly to a file, streaming it in chunks.
 
         Args:
             media_id: WhatsApp media ID
@@ -223,13 +258,27 @@ class MediaService:
                 "/path/to/save/image.jpg"
             )
         """
-        content = self.download(media_id)
+        url = self._download_url(media_id)
 
         file_path_obj = Path(file_path)
         file_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(file_path_obj, "wb") as f:
-            f.write(content)
+        # Stream to disk so the whole file is never held in memory. Chunks go
+        # to a ".part" file that replaces the target only once complete, so a
+        # failed download leaves any existing file untouched
+        part_path = file_path_obj.with_name(f"{file_path_obj.name}.part")
+        try:
+            with open(part_path, "wb") as f:
+                for chunk in self.http_client.stream_binary(url):
+                    f.write(chunk)
+        except WhatsAppError as e:
+            part_path.unlink(missing_ok=True)
+            self._forget_url(media_id)
+            raise WhatsAppMediaError(f"Download failed: {e}") from e
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        os.replace(part_path, file_path_obj)
 
         return str(file_path_obj)
 
@@ -252,15 +301,47 @@ class MediaService:
             if success:
                 print("Media deleted successfully")
         """
+        self._forget_url(media_id)
         response = self.http_client.delete(f"{media_id}")
-        result = MediaDeleteResponse(**response)
-        return result.success
+        return bool(response.get("success"))
 
     # ========================================================================
     # UTILITY METHODS
     # ========================================================================
 
-    def _validate_file_size(self, mime_type: str, file_size: int) -> None:
+    def _download_url(self, media_id: str) -> str:
+        """Get a download URL, reusing one fetched within the last few minutes.
+
+        Args:
+            media_id: WhatsApp media ID
+
+        Returns:
+            Download URL
+        """
+        now = time.monotonic()
+        cached = self._url_cache.get(media_id)
+        if cached is not None and now < cached[1]:
+            return cached[0]
+
+        url = self.get_url(media_id)
+        with self._url_cache_lock:
+            # Evict the oldest entry (dicts keep insertion order) to bound memory
+            if media_id not in self._url_cache and len(self._url_cache) >= _URL_CACHE_SIZE:
+                del self._url_cache[next(iter(self._url_cache))]
+            self._url_cache[media_id] = (url, now + _URL_CACHE_TTL)
+        return url
+
+    def _forget_url(self, media_id: str) -> None:
+        """Drop a cached download URL, e.g. after it failed or was deleted.
+
+        Args:
+            media_id: WhatsApp media ID
+        """
+        with self._url_cache_lock:
+            self._url_cache.pop(media_id, None)
+
+    @staticmethod
+    def _validate_file_size(mime_type: str, file_size: int) -> None:
         """Validate file size based on media type.
 
         Args:
@@ -270,34 +351,14 @@ class MediaService:
         Raises:
             WhatsAppMediaError: If file size exceeds limits
         """
-        # Define size limits (in bytes)
-        size_limits = {
-            "image": 5 * 1024 * 1024,  # 5MB
-            "video": 16 * 1024 * 1024,  # 16MB
-            "audio": 16 * 1024 * 1024,  # 16MB
-            "document": 100 * 1024 * 1024,  # 100MB
-            "sticker": 512 * 1024,  # 512KB
-        }
-
-        # Determine media type from MIME type
-        if mime_type.startswith("image/"):
-            if mime_type == "image/webp":
-                # Could be a sticker
-                max_size = size_limits["sticker"]
-                media_type = "sticker"
-            else:
-                max_size = size_limits["image"]
-                media_type = "image"
-        elif mime_type.startswith("video/"):
-            max_size = size_limits["video"]
-            media_type = "video"
-        elif mime_type.startswith("audio/"):
-            max_size = size_limits["audio"]
-            media_type = "audio"
-        else:
-            # Treat as document
-            max_size = size_limits["document"]
-            media_type = "document"
+        if file_size <= _MIN_SIZE_LIMIT:
+            return
+
+        # Exact MIME types take precedence (webp may be a sticker), then the
+        # "type/" prefix; anything else is treated as a document
+        media_type, max_size = _SIZE_LIMITS.get(mime_type) or _SIZE_LIMITS.get(
+            mime_type[: mime_type.find("/") + 1], _DOCUMENT_LIMIT
+        )
 
         if file_size > max_size:
             raise WhatsAppMediaError(
@@ -15,11 +15,13 @@ from whatsapp_sdk.models import (
     DocumentMessage,
     ImageMessage,
     InteractiveMessage,
+    LocationMessage,
     MessageResponse,
     StickerMessage,
     TextMessage,
     VideoMessage,
 )
+from whatsapp_sdk.services._utils import format_phone_number
 
 if TYPE_CHECKING:
     from whatsapp_sdk.config import WhatsAppConfig
@@ -339,6 +341,9 @@ class MessagesService:
         Returns:
             MessageResponse with message ID and status
 
+        Raises:
+            ValidationError: If latitude or longitude is out of range
+
         Examples:
             # Basic location
             response = messages.send_location(
@@ -354,11 +359,10 @@ class MessagesService:
                 address="1 Hacker Way, Menlo Park, CA"
             )
         """
-        location_data: Dict[str, Any] = {"latitude": latitude, "longitude": longitude}
-        if name:
-            location_data["name"] = name
-        if address:
-            location_data["address"] = address
+        # Coordinate ranges are checked by the model's field constraints
+        location_data = LocationMessage(
+            latitude=latitude, longitude=longitude, name=name or None, address=address or None
+        ).model_dump(exclude_none=True)
 
         payload = {
             "messaging_product": "whatsapp",
@@ -532,20 +536,4 @@ class MessagesService:
     # UTILITY METHODS
     # ========================================================================
 
-    def _format_phone_number(self, phone: str) -> str:
-        """Format phone number for WhatsApp API.
-
-        Args:
-            phone: Phone number in any format
-
-        Returns:
-            Formatted phone number (digits only)
-        """
-        # Remove all non-digit characters
-        formatted = "".join(filter(str.isdigit, phone))
-
-        # Validate length (7-15 digits per WhatsApp requirements)
-        if len(formatted) < 7 or len(formatted) > 15:
-            raise ValueError(f"Invalid phone number length: {formatted}")
-
-        return formatted
+    _format_phone_number = staticmethod(format_phone_number)
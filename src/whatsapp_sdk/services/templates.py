@@ -6,6 +6,7 @@ creating, listing, updating, and deleting templates.
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from whatsapp_sdk.models import (
@@ -15,11 +16,15 @@ from whatsapp_sdk.models import (
     TemplateListResponse,
     TemplateResponse,
 )
+from whatsapp_sdk.services._utils import format_phone_number
 
 if TYPE_CHECKING:
     from whatsapp_sdk.config import WhatsAppConfig
     from whatsapp_sdk.http_client import HTTPClient
 
+# Template names: lowercase letters, digits and underscores, up to 512 characters
+_TEMPLATE_NAME_RE = re.compile(r"[a-z0-9_]{1,512}")
+
 
 class TemplatesService:
     """Service for managing WhatsApp message templates.
@@ -39,6 +44,7 @@ class TemplatesService:
         self.config = config
         self.phone_number_id = phone_number_id
         self.base_url = f"{config.base_url}/{phone_number_id}"
+        self.messages_url = f"{self.base_url}/messages"
 
     # ========================================================================
     # SEND TEMPLATE MESSAGE
@@ -123,20 +129,19 @@ class TemplatesService:
             formatted_components = None
 
         # Build payload
+        template: Dict[str, Any] = {"name": template_name, "language": {"code": language_code}}
+        if formatted_components:
+            template["components"] = formatted_components
+
         payload = {
             "messaging_product": "whatsapp",
             "recipient_type": "individual",
             "to": self._format_phone_number(to),
             "type": "template",
-            "template": {"name": template_name, "language": {"code": language_code}},
+            "template": template,
         }
 
-        if formatted_components:
-            template_dict = payload["template"]
-            if isinstance(template_dict, dict):
-                template_dict["components"] = formatted_components
-
-        response = self.http_client.post(f"{self.base_url}/messages", json=payload)
+        response = self.http_client.post(self.messages_url, json=payload)
         return MessageResponse(**response)
 
     # ========================================================================
@@ -154,7 +159,7 @@ class TemplatesService:
         """Create a new message template.
 
         Args:
-            name: Template name (must be unique)
+            name: Template name (must be unique; lowercase letters, digits and underscores)
             category: Template category (MARKETING, UTILITY, or AUTHENTICATION)
             language: Language code (e.g., en_US)
             components: Template components (header, body, footer, buttons)
@@ -163,6 +168,11 @@ class TemplatesService:
         Returns:
             TemplateResponse with template ID and status
 
+        Raises:
+            ValueError: If the template name, after surrounding whitespace is
+                stripped, is not lowercase letters, digits and underscores
+                (max 512)
+
         Examples:
             # Create a simple template
             response = templates.create(
@@ -212,6 +222,11 @@ class TemplatesService:
                 ]
             )
         """
+        # Validate before any API call; Meta only accepts lowercase template names
+        name = name.strip()
+        if not _TEMPLATE_NAME_RE.fullmatch(name):
+            raise ValueError(f"Invalid template name: {name!r}")
+
         # Get WhatsApp Business Account ID (WABA ID)
         # This is typically different from phone_number_id
         # For now, we'll need to fetch it or have it configured
@@ -338,23 +353,7 @@ class TemplatesService:
     # UTILITY METHODS
     # ========================================================================
 
-    def _format_phone_number(self, phone: str) -> str:
-        """Format phone number for WhatsApp API.
-
-        Args:
-            phone: Phone number in any format
-
-        Returns:
-            Formatted phone number (digits only)
-        """
-        # Remove all non-digit characters
-        formatted = "".join(filter(str.isdigit, phone))
-
-        # Validate length (7-15 digits per WhatsApp requirements)
-        if len(formatted) < 7 or len(formatted) > 15:
-            raise ValueError(f"Invalid phone number length: {formatted}")
-
-        return formatted
+    _format_phone_number = staticmethod(format_phone_number)
 
     def _get_waba_id(self) -> str:
         """Get WhatsApp Business Account ID.
@@ -6,11 +6,11 @@ for incoming WhatsApp webhook events.
 
 from __future__ import annotations
 
-import hashlib
 import hmac
-import json
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from pydantic import ValidationError
+
 from whatsapp_sdk.exceptions import WhatsAppWebhookError
 from whatsapp_sdk.models import WebhookEvent, WebhookMessage, WebhookStatus
 
@@ -32,6 +32,12 @@ class WebhooksService:
         """
         self.config = config
 
+        # Encode the secrets once; they are used on every webhook request
+        self._app_secret_bytes = config.app_secret.encode("utf-8") if config.app_secret else None
+        self._verify_token_bytes = (
+            config.webhook_verify_token.encode("utf-8") if config.webhook_verify_token else None
+        )
+
     # ========================================================================
     # WEBHOOK VERIFICATION
     # ========================================================================
@@ -50,10 +56,14 @@ class WebhooksService:
             if webhooks.verify_token(request.args.get("hub.verify_token")):
                 return request.args.get("hub.challenge")
         """
-        if not self.config.webhook_verify_token:
+        if self._verify_token_bytes is None:
             raise WhatsAppWebhookError("Webhook verify token not configured")
 
-        return token == self.config.webhook_verify_token
+        if not isinstance(token, str):
+            return False
+
+        # Constant time comparison so the token cannot be guessed by timing
+        return hmac.compare_digest(token.encode("utf-8"), self._verify_token_bytes)
 
     def verify_signature(self, signature: str, payload: bytes) -> bool:
         """Verify webhook signature for security.
@@ -73,22 +83,24 @@ class WebhooksService:
             if not webhooks.verify_signature(signature, payload):
                 return "Invalid signature", 403
         """
-        if not self.config.app_secret:
+        if self._app_secret_bytes is None:
             raise WhatsAppWebhookError("App secret not configured")
 
         # Extract the hash from the signature (format: sha256=hash)
         if not signature or not signature.startswith("sha256="):
             return False
 
-        signature_hash = signature[7:]  # Remove "sha256=" prefix
+        # Compare raw digests rather than hex strings: half the bytes to scan
+        # and no hexdigest() allocation per webhook
+        try:
+            signature_bytes = bytes.fromhex(signature[7:])  # Remove "sha256=" prefix
+        except ValueError:
+            return False
 
-        # Calculate expected hash
-        expected_hash = hmac.new(
-            self.config.app_secret.encode("utf-8"), payload, hashlib.sha256
-        ).hexdigest()
+        expected = hmac.digest(self._app_secret_bytes, payload, "sha256")
 
-        # Compare hashes (constant time comparison for security)
-        return hmac.compare_digest(signature_hash, expected_hash)
+        # Compare digests (constant time comparison for security)
+        return hmac.compare_digest(signature_bytes, expected)
 
     # ========================================================================
     # EVENT PARSING
@@ -224,13 +236,14 @@ class WebhooksService:
         if not self.verify_signature(signature, payload):
             raise WhatsAppWebhookError("Invalid webhook signature")
 
-        # Parse payload
+        # Parse and validate the raw bytes in one pass, without building an
+        # intermediate dict tree for pydantic to walk again
         try:
-            data = json.loads(payload)
-        except json.JSONDecodeError:
-            raise WhatsAppWebhookError("Invalid JSON payload") from None
-
-        return self.parse_event(data)
+            return WebhookEvent.model_validate_json(payload)
+        except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                raise WhatsAppWebhookError("Invalid JSON payload") from None
+            raise
 
     # ========================================================================
     # UTILITY METHODS
@@ -253,15 +266,12 @@ class WebhooksService:
                 print(f"From: {message.from_}")
                 print(f"Type: {message.type}")
         """
-        messages = []
-
-        for entry in event.entry:
-            for change in entry.changes:
-                if change.value.messages:
-                    for msg in change.value.messages:
-                        messages.append(msg)
-
-        return messages
+        return [
+            msg
+            for entry in event.entry
+            for change in entry.changes
+            for msg in change.value.messages or ()
+        ]
 
     def extract_statuses(self, event: WebhookEvent) -> List[WebhookStatus]:
         """Extract all status updates from a webhook event.
@@ -280,12 +290,9 @@ class WebhooksService:
                 print(f"Message ID: {status.id}")
                 print(f"Status: {status.status}")
         """
-        statuses = []
-
-        for entry in event.entry:
-            for change in entry.changes:
-                if change.value.statuses:
-                    for status in change.value.statuses:
-                        statuses.append(status)
-
-        return statuses
+        return [
+            status
+            for entry in event.entry
+            for change in entry.changes
+            for status in change.value.statuses or ()
+        ]
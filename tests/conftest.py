@@ -2,44 +2,108 @@
 
 from __future__ import annotations
 
-import os
-import sys
-from typing import Any, Dict
-from unittest.mock import Mock, patch
+import copy
+import json
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
 
 import pytest
 
-from whatsapp_sdk import WhatsAppClient
-from whatsapp_sdk.config import WhatsAppConfig
-from whatsapp_sdk.http_client import HTTPClient
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedups extra
+    orjson = None  # type: ignore[assignment]
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+if TYPE_CHECKING:
+    from typing import Any, Callable, Mapping
+
+    from whatsapp_sdk import WhatsAppClient
+    from whatsapp_sdk.config import WhatsAppConfig
+
+# Environment applied by the mock_env fixture
+_TEST_ENV: dict[str, str] = {
+    "WHATSAPP_PHONE_NUMBER_ID": "123456789",
+    "WHATSAPP_ACCESS_TOKEN": "test_token",
+    "WHATSAPP_APP_SECRET": "test_secret",
+    "WHATSAPP_WEBHOOK_VERIFY_TOKEN": "verify_token",
+}
+
+# Read-only send-message response; mutating it raises TypeError
+_MOCK_HTTP_RESPONSE: Mapping[str, Any] = MappingProxyType(
+    {
+        "messaging_product": "whatsapp",
+        "contacts": (MappingProxyType({"input": "+1234567890", "wa_id": "1234567890"}),),
+        "messages": (MappingProxyType({"id": "wamid.123456"}),),
+    }
+)
+
+# Read-only webhook payload shared by the webhook fixtures
+_SAMPLE_WEBHOOK_PAYLOAD: dict[str, Any] = {
+    "object": "whatsapp_business_account",
+    "entry": [
+        {
+            "id": "XXXX",
+            "changes": [
+                {
+                    "field": "messages",
+                    "value": {
+                        "messaging_product": "whatsapp",
+                        "metadata": {
+                            "display_phone_number": "16505551234",
+                            "phone_number_id": "123456789",
+                        },
+                        "contacts": [
+                            {
+                                "profile": {"name": "Test User"},
+                                "wa_id": "16505551234",
+                            }
+                        ],
+                        "messages": [
+                            {
+                                "from": "16505551234",
+                                "id": "wamid.test123",
+                                "timestamp": "1669233778",
+                                "type": "text",
+                                "text": {"body": "Hello!"},
+                            }
+                        ],
+                    },
+                }
+            ],
+        }
+    ],
+}
+
+# Raw request body for the payload above, serialized once for signature tests
+_SAMPLE_WEBHOOK_PAYLOAD_BYTES: bytes = (
+    orjson.dumps(_SAMPLE_WEBHOOK_PAYLOAD)
+    if orjson
+    else json.dumps(_SAMPLE_WEBHOOK_PAYLOAD).encode("utf-8")
+)
 
 
 @pytest.fixture()
 def mock_env(monkeypatch) -> None:
-    """Mock environment variables."""
+    """Mock environment variables.
 
-    monkeypatch.setenv("WHATSAPP_PHONE_NUMBER_ID", "123456789")
-    monkeypatch.setenv("WHATSAPP_ACCESS_TOKEN", "test_token")
-    monkeypatch.setenv("WHATSAPP_APP_SECRET", "test_secret")
-    monkeypatch.setenv("WHATSAPP_WEBHOOK_VERIFY_TOKEN", "verify_token")
+    Function-scoped on purpose: other tests rely on these being unset.
+    """
 
+    for name, value in _TEST_ENV.items():
+        monkeypatch.setenv(name, value)
 
-@pytest.fixture()
-def mock_http_response() -> Dict[str, Any]:
-    """Create a mock HTTP response."""
-    return {
-        "messaging_product": "whatsapp",
-        "contacts": [{"input": "+1234567890", "wa_id": "1234567890"}],
-        "messages": [{"id": "wamid.123456"}],
-    }
 
+@pytest.fixture(scope="session")
+def mock_http_response() -> Mapping[str, Any]:
+    """Create a mock HTTP response (read-only, shared by all tests)."""
+    return _MOCK_HTTP_RESPONSE
 
-@pytest.fixture()
+
+@pytest.fixture(scope="session")
 def mock_config() -> WhatsAppConfig:
-    """Create a mock configuration."""
+    """Create a mock configuration (immutable, shared by all tests)."""
+    from whatsapp_sdk.config import WhatsAppConfig
 
     return WhatsAppConfig(
         phone_number_id="123456789",
@@ -52,65 +116,64 @@ def mock_config() -> WhatsAppConfig:
 
 
 @pytest.fixture()
-def mock_http_client(mock_http_response) -> Mock:
+def make_http_client(mock_http_response, mock_config) -> Callable[..., Mock]:
+    """Factory for mock HTTP clients.
+
+    Keyword arguments override the return value of the named client method.
+    """
+    from whatsapp_sdk.http_client import HTTPClient
+
+    def _make(**return_values: Any) -> Mock:
+        values = {
+            "post": mock_http_response,
+            "get": {"data": [], "paging": {}},
+            "delete": {"success": True},
+            "upload_multipart": {"id": "media_123"},
+            "download_binary": b"fake_binary_data",
+            "stream_binary": (b"fake_binary_data",),
+            **return_values,
+        }
+        mock = Mock(spec=HTTPClient)
+        mock.configure_mock(
+            base_url="https://graph.facebook.com/v23.0",
+            config=mock_config,
+            **{name: Mock(return_value=value) for name, value in values.items()},
+        )
+        return mock
+
+    return _make
+
+
+@pytest.fixture()
+def mock_http_client(make_http_client) -> Mock:
     """Create a mock HTTP client."""
 
-    mock = Mock(spec=HTTPClient)
-    mock.post = Mock(return_value=mock_http_response)
-    mock.get = Mock(return_value={"data": [], "paging": {}})
-    mock.delete = Mock(return_value={"success": True})
-    mock.base_url = "https://graph.facebook.com/v23.0"
-    mock.upload_multipart = Mock(return_value={"id": "media_123"})
-    mock.download_binary = Mock(return_value=b"fake_binary_data")
-    return mock
+    return make_http_client()
 
 
 @pytest.fixture()
-def client(mock_config, mock_http_client) -> WhatsAppClient:
+def client(mock_http_client) -> WhatsAppClient:
     """Create WhatsApp client with mocked dependencies."""
+    from whatsapp_sdk import WhatsAppClient
 
-    with patch("whatsapp_sdk.client.HTTPClient", return_value=mock_http_client):
-        return WhatsAppClient(
-            phone_number_id="123456789",
-            access_token="test_token",
-        )
+    return WhatsAppClient(
+        phone_number_id="123456789", access_token="test_token", http_client=mock_http_client
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_webhook_payload() -> dict[str, Any]:
+    """Sample webhook payload (shared; do not mutate)."""
+    return _SAMPLE_WEBHOOK_PAYLOAD
+
+
+@pytest.fixture(scope="session")
+def sample_webhook_payload_bytes() -> bytes:
+    """Sample webhook payload as a raw HTTP request body."""
+    return _SAMPLE_WEBHOOK_PAYLOAD_BYTES
 
 
 @pytest.fixture()
-def sample_webhook_payload() -> Dict[str, Any]:
-    """Sample webhook payload."""
-    return {
-        "object": "whatsapp_business_account",
-        "entry": [
-            {
-                "id": "XXXX",
-                "changes": [
-                    {
-                        "field": "messages",
-                        "value": {
-                            "messaging_product": "whatsapp",
-                            "metadata": {
-                                "display_phone_number": "16505551234",
-                                "phone_number_id": "123456789",
-                            },
-                            "contacts": [
-                                {
-                                    "profile": {"name": "Test User"},
-                                    "wa_id": "16505551234",
-                                }
-                            ],
-                            "messages": [
-                                {
-                                    "from": "16505551234",
-                                    "id": "wamid.test123",
-                                    "timestamp": "1669233778",
-                                    "type": "text",
-                                    "text": {"body": "Hello!"},
-                                }
-                            ],
-                        },
-                    }
-                ],
-            }
-        ],
-    }
+def sample_webhook_payload_mutable() -> dict[str, Any]:
+    """Sample webhook payload that tests may modify."""
+    return copy.deepcopy(_SAMPLE_WEBHOOK_PAYLOAD)
@@ -0,0 +1,67 @@
+"""Tests for message request models."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from whatsapp_sdk.models import (
+    AudioMessage,
+    Button,
+    ButtonReply,
+    DocumentMessage,
+    ImageMessage,
+    Section,
+    SectionRow,
+    StickerMessage,
+    VideoMessage,
+)
+
+MEDIA_MODELS = (AudioMessage, DocumentMessage, ImageMessage, StickerMessage, VideoMessage)
+
+
+class TestMediaMessages:
+    """Test media message models."""
+
+    @pytest.mark.parametrize("model", MEDIA_MODELS)
+    def test_id_or_link(self, model):
+        """Test media can be referenced by ID or by link."""
+        assert model(id="media_123").id == "media_123"
+        assert model(link="https://example.com/file").link == "https://example.com/file"
+
+    @pytest.mark.parametrize("model", MEDIA_MODELS)
+    def test_id_and_link_rejected(self, model):
+        """Test providing both ID and link is rejected."""
+        with pytest.raises(ValidationError, match="Provide either 'id' or 'link', not both"):
+            model(id="media_123", link="https://example.com/file")
+
+
+class TestInteractiveMessages:
+    """Test interactive message models."""
+
+    def test_button_reply_from_dict(self):
+        """Test button replies given as dicts are validated into models."""
+        button = Button(reply={"id": "yes", "title": "Yes"})
+
+        assert isinstance(button.reply, ButtonReply)
+        assert button.model_dump() == {"type": "reply", "reply": {"id": "yes", "title": "Yes"}}
+
+    def test_button_reply_title_too_long(self):
+        """Test button titles longer than 20 characters are rejected."""
+        with pytest.raises(ValidationError):
+            Button(reply={"id": "yes", "title": "x" * 21})
+
+    def test_section_rows(self):
+        """Test section rows are validated and optional fields are dropped."""
+        section = Section(title="Options", rows=[{"id": "1", "title": "First"}])
+
+        assert isinstance(section.rows[0], SectionRow)
+        assert section.model_dump(exclude_none=True) == {
+            "title": "Options",
+            "rows": [{"id": "1", "title": "First"}],
+        }
+
+    def test_section_row_requires_title(self):
+        """Test rows without a title are rejected."""
+        with pytest.raises(ValidationError):
+            Section(rows=[{"id": "1"}])
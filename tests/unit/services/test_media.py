@@ -2,14 +2,64 @@
 
 from __future__ import annotations
 
-from unittest.mock import mock_open, patch
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import Mock
 
 import pytest
 
-from whatsapp_sdk.exceptions import WhatsAppMediaError
+from whatsapp_sdk.exceptions import (
+    WhatsAppAPIError,
+    WhatsAppMediaError,
+    WhatsAppRateLimitError,
+)
 from whatsapp_sdk.models import MediaUploadResponse
+from whatsapp_sdk.services import media
 from whatsapp_sdk.services.media import MediaService
 
+MB = 1024 * 1024
+
+# Media URL lookup response; tests add the media "id"
+_MEDIA_META = MappingProxyType(
+    {
+        "url": "https://example.com/media/file.jpg",
+        "mime_type": "image/jpeg",
+        "sha256": "hash123",
+        "file_size": 1024,
+    }
+)
+
+# (file path, MIME type guessed for it)
+_MIME_CASES = (
+    ("file.jpg", "image/jpeg"),
+    ("file.png", "image/png"),
+    ("file.mp4", "video/mp4"),
+    ("file.mp3", "audio/mpeg"),
+    ("file.pdf", "application/pdf"),
+    ("file.webp", "image/webp"),
+)
+
+# (MIME type, maximum accepted size in bytes)
+_SIZE_LIMIT_CASES = (
+    ("image/jpeg", 5 * MB),
+    ("video/mp4", 16 * MB),
+    ("audio/mpeg", 16 * MB),
+    ("application/pdf", 100 * MB),
+    ("image/webp", 512 * 1024),  # sticker
+)
+
+
+class _FakeBytes:
+    """Stand-in for a large payload that reports a size without allocating it."""
+
+    def __init__(self, size):
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
 
 class TestMediaService:
     """Test media service functionality."""
@@ -23,155 +73,176 @@ class TestMediaService:
             phone_number_id="123456789"
         )
 
+    @pytest.fixture()
+    def make_file(self, tmp_path):
+        """Create a real file of the given size and return its path.
+
+        Files are sparse, so sizes up to the 100MB document limit are cheap.
+        """
+
+        def _make(name, size=1024):
+            path = tmp_path / name
+            with open(path, "wb") as f:
+                f.truncate(size)
+            return str(path)
+
+        return _make
+
     # ========================================================================
     # UPLOAD TESTS
     # ========================================================================
 
-    def test_upload_success_with_auto_mime_detection(self, media_service, mock_http_client):
+    def test_upload_success_with_auto_mime_detection(
+        self, media_service, mock_http_client, make_file
+    ):
         """Test successful file upload with automatic MIME type detection."""
-        # Mock file system operations
-        with patch("pathlib.Path.exists", return_value=True), \
-             patch("pathlib.Path.stat") as mock_stat, \
-             patch("mimetypes.guess_type", return_value=("image/jpeg", None)), \
-             patch("builtins.open", mock_open(read_data=b"fake_image_data")):
-            # Setup file size
-            mock_stat.return_value.st_size = 1024 * 1024  # 1MB
-
-            # Mock HTTP response
-            mock_http_client.upload_multipart.return_value = {"id": "media_123"}
-
-            # Test upload
-            response = media_service.upload("/path/to/image.jpg")
-
-            # Verify response
-            assert isinstance(response, MediaUploadResponse)
-            assert response.id == "media_123"
-
-            # Verify HTTP client was called correctly
-            mock_http_client.upload_multipart.assert_called_once()
-            call_args = mock_http_client.upload_multipart.call_args
-            assert "123456789/media" in call_args[0][0]
-            assert call_args[1]["data"]["type"] == "image/jpeg"
-
-    def test_upload_success_with_explicit_mime_type(self, media_service, mock_http_client):
-        """Test successful file upload with explicit MIME type."""
-        with patch("pathlib.Path.exists", return_value=True), \
-             patch("pathlib.Path.stat") as mock_stat, \
-             patch("builtins.open", mock_open(read_data=b"fake_image_data")):
-            # Setup file size
-            mock_stat.return_value.st_size = 1024 * 1024  # 1MB
-
-            # Mock HTTP response
-            mock_http_client.upload_multipart.return_value = {"id": "media_456"}
-
-            # Test upload with explicit MIME type
-            response = media_service.upload(
-                "/path/to/image.jpg",
-                mime_type="image/png"
-            )
-
-            # Verify response
-            assert isinstance(response, MediaUploadResponse)
-            assert response.id == "media_456"
-
-            # Verify explicit MIME type was used
-            call_args = mock_http_client.upload_multipart.call_args
-            assert call_args[1]["data"]["type"] == "image/png"
-
-    def test_upload_file_not_found(self, media_service):
-        """Test upload failure when file doesn't exist."""
-        with patch("pathlib.Path.exists", return_value=False), \
-             pytest.raises(WhatsAppMediaError, match="File not found"):
-            media_service.upload("/nonexistent/file.jpg")
+        path = make_file("image.jpg", MB)
 
-    def test_upload_mime_type_detection_failure(self, media_service):
-        """Test upload failure when MIME type cannot be detected."""
-        with patch("pathlib.Path.exists", return_value=True), \
-             patch("mimetypes.guess_type", return_value=(None, None)), \
-             pytest.raises(WhatsAppMediaError, match="Could not determine MIME type"):
-            media_service.upload("/path/to/unknown.xyz")
-
-    def test_upload_file_size_validation_image(self, media_service):
-        """Test file size validation for images."""
-        with patch("pathlib.Path.exists", return_value=True), \
-             patch("pathlib.Path.stat") as mock_stat, \
-             patch("mimetypes.guess_type", return_value=("image/jpeg", None)), \
-             patch("builtins.open", mock_open(read_data=b"x" * (5 * 1024 * 1024 + 1))):
-            # Setup file size over limit (5MB + 1 byte)
-            mock_stat.return_value.st_size = 5 * 1024 * 1024 + 1
-
-            with pytest.raises(WhatsAppMediaError, match="File size .* exceeds limit"):
-                media_service.upload("/path/to/large_image.jpg")
-
-    def test_upload_file_size_validation_video(self, media_service):
-        """Test file size validation for videos."""
-        with patch("pathlib.Path.exists", return_value=True), \
-             patch("pathlib.Path.stat") as mock_stat, \
-             patch("mimetypes.guess_type", return_value=("video/mp4", None)), \
-             patch("builtins.open", mock_open(read_data=b"x" * (16 * 1024 * 1024 + 1))):
-            # Setup file size over limit (16MB + 1 byte)
-            mock_stat.return_value.st_size = 16 * 1024 * 1024 + 1
-
-            with pytest.raises(WhatsAppMediaError, match="File size .* exceeds limit"):
-                media_service.upload("/path/to/large_video.mp4")
-
-    def test_upload_file_size_validation_sticker(self, media_service):
-        """Test file size validation for stickers (webp)."""
-        with patch("pathlib.Path.exists", return_value=True), \
-             patch("pathlib.Path.stat") as mock_stat, \
-             patch("mimetypes.guess_type", return_value=("image/webp", None)), \
-             patch("builtins.open", mock_open(read_data=b"x" * (512 * 1024 + 1))):
-            # Setup file size over limit (512KB + 1 byte)
-            mock_stat.return_value.st_size = 512 * 1024 + 1
-
-            with pytest.raises(WhatsAppMediaError, match="File size .* exceeds limit"):
-                media_service.upload("/path/to/large_sticker.webp")
-
-    def test_upload_from_bytes_success(self, media_service, mock_http_client):
-        """Test successful upload from bytes."""
         # Mock HTTP response
-        mock_http_client.upload_multipart.return_value = {"id": "media_bytes_123"}
+        mock_http_client.upload_multipart.return_value = {"id": "media_123"}
 
-        # Test upload from bytes
-        file_bytes = b"test_file_content"
-        response = media_service.upload_from_bytes(
-            file_bytes,
-            mime_type="image/jpeg",
-            filename="test.jpg"
-        )
+        # Test upload
+        response = media_service.upload(path)
 
         # Verify response
         assert isinstance(response, MediaUploadResponse)
-        assert response.id == "media_bytes_123"
+        assert response.id == "media_123"
 
         # Verify HTTP client was called correctly
         mock_http_client.upload_multipart.assert_called_once()
+        call_args = mock_http_client.upload_multipart.call_args
+        assert "123456789/media" in call_args[0][0]
+        assert call_args[1]["data"]["type"] == "image/jpeg"
+
+    def test_upload_success_with_explicit_mime_type(
+        self, media_service, mock_http_client, make_file
+    ):
+        """Test successful file upload with explicit MIME type."""
+        path = make_file("image.jpg", MB)
+
+        # Mock HTTP response
+        mock_http_client.upload_multipart.return_value = {"id": "media_456"}
+
+        # Test upload with explicit MIME type
+        response = media_service.upload(path, mime_type="image/png")
+
+        # Verify response
+        assert response.id == "media_456"
+
+        # Verify explicit MIME type was used
+        call_args = mock_http_client.upload_multipart.call_args
+        assert call_args[1]["data"]["type"] == "image/png"
+
+    def test_upload_reads_size_from_open_file(self, media_service, mock_http_client, tmp_path):
+        """Test the size check uses the opened file on a real filesystem."""
+        sticker = tmp_path / "sticker.webp"
+        sticker.write_bytes(b"x" * (512 * 1024 + 1))
+
+        with pytest.raises(WhatsAppMediaError, match=r"File size .* exceeds limit"):
+            media_service.upload(str(sticker))
+        mock_http_client.upload_multipart.assert_not_called()
+
+    def test_upload_guesses_mime_type_case_insensitively(
+        self, media_service, mock_http_client, tmp_path
+    ):
+        """Test MIME detection on a real file ignores extension case."""
+        image = tmp_path / "photo.JPG"
+        image.write_bytes(b"fake_image_data")
+
+        media_service.upload(str(image))
+
         call_args = mock_http_client.upload_multipart.call_args
         assert call_args[1]["data"]["type"] == "image/jpeg"
 
-    def test_upload_from_bytes_without_explicit_filename(self, media_service, mock_http_client):
-        """Test upload from bytes with generic filename."""
+    def test_upload_guesses_mime_type_for_compound_extension(
+        self, media_service, mock_http_client, tmp_path
+    ):
+        """Test MIME detection resolves compound extensions such as .tar.gz."""
+        archive = tmp_path / "backup.tar.gz"
+        archive.write_bytes(b"fake_archive_data")
+
+        media_service.upload(str(archive))
+
+        call_args = mock_http_client.upload_multipart.call_args
+        assert call_args[1]["data"]["type"] == "application/x-tar"
+
+    def test_upload_file_not_found(self, media_service, tmp_path):
+        """Test upload failure when file doesn't exist."""
+        with pytest.raises(WhatsAppMediaError, match="File not found"):
+            media_service.upload(str(tmp_path / "file.jpg"))
+
+    def test_upload_transport_file_not_found_not_misreported(
+        self, media_service, mock_http_client, tmp_path
+    ):
+        """Test a FileNotFoundError raised during the upload is not reported as a missing file."""
+        image = tmp_path / "image.jpg"
+        image.write_bytes(b"fake_image_data")
+        mock_http_client.upload_multipart.side_effect = FileNotFoundError("ca bundle")
+
+        with pytest.raises(FileNotFoundError, match="ca bundle"):
+            media_service.upload(str(image))
+
+    def test_upload_mime_type_detection_failure(self, media_service, make_file, monkeypatch):
+        """Test upload failure when MIME type cannot be detected."""
+        path = make_file("unknown.xyz")
+        # Some platforms map .xyz to a chemical MIME type, so force a miss
+        monkeypatch.setattr(media, "_guess_mime_type", lambda filename: None)
+
+        with pytest.raises(WhatsAppMediaError, match="Could not determine MIME type"):
+            media_service.upload(path)
+
+    @pytest.mark.parametrize(
+        ("size", "name"),
+        [
+            (5 * MB + 1, "large_image.jpg"),
+            (16 * MB + 1, "large_video.mp4"),
+            (512 * 1024 + 1, "large_sticker.webp"),
+        ],
+        ids=["image", "video", "sticker"],
+    )
+    def test_upload_file_size_validation(self, media_service, make_file, size, name):
+        """Test uploads one byte over the media type's limit are rejected."""
+        path = make_file(name, size)
+
+        with pytest.raises(WhatsAppMediaError, match=r"File size .* exceeds limit"):
+            media_service.upload(path)
+
+    @pytest.mark.parametrize(
+        ("file_bytes", "mime_type", "filename"),
+        [
+            (b"test_file_content", "image/jpeg", "test.jpg"),
+            (b"test_content", "application/pdf", "file.pdf"),
+        ],
+        ids=["image", "document"],
+    )
+    def test_upload_from_bytes_success(
+        self, media_service, mock_http_client, file_bytes, mime_type, filename
+    ):
+        """Test successful upload from bytes."""
         # Mock HTTP response
-        mock_http_client.upload_multipart.return_value = {"id": "media_noname_123"}
+        mock_http_client.upload_multipart.return_value = {"id": "media_bytes_123"}
 
-        # Test upload with generic filename
-        file_bytes = b"test_content"
+        # Test upload from bytes
         response = media_service.upload_from_bytes(
-            file_bytes,
-            mime_type="application/pdf",
-            filename="file.pdf"  # MediaService requires filename
+            file_bytes, mime_type=mime_type, filename=filename
         )
 
         # Verify response
         assert isinstance(response, MediaUploadResponse)
-        assert response.id == "media_noname_123"
+        assert response.id == "media_bytes_123"
+
+        # Verify HTTP client was called correctly
+        mock_http_client.upload_multipart.assert_called_once()
+        call_args = mock_http_client.upload_multipart.call_args
+        assert call_args[1]["files"]["file"] == (filename, file_bytes, mime_type)
+        assert call_args[1]["data"]["type"] == mime_type
 
     def test_upload_from_bytes_size_validation(self, media_service):
         """Test file size validation for bytes upload."""
-        # Create bytes over image size limit
-        large_bytes = b"x" * (5 * 1024 * 1024 + 1)
+        # Only len() is consulted before the size check fails
+        large_bytes = _FakeBytes(5 * MB + 1)
 
-        with pytest.raises(WhatsAppMediaError, match="File size .* exceeds limit"):
+        with pytest.raises(WhatsAppMediaError, match=r"File size .* exceeds limit"):
             media_service.upload_from_bytes(large_bytes, mime_type="image/jpeg", filename="large.jpg")
 
     def test_upload_from_bytes_empty_bytes(self, media_service, mock_http_client):
@@ -181,7 +252,6 @@ class TestMediaService:
         mock_http_client.upload_multipart.return_value = {"id": "empty_123"}
 
         response = media_service.upload_from_bytes(b"", mime_type="image/jpeg", filename="empty.jpg")
-        assert isinstance(response, MediaUploadResponse)
         assert response.id == "empty_123"
 
     # ========================================================================
@@ -191,13 +261,7 @@ class TestMediaService:
     def test_get_url_success(self, media_service, mock_http_client):
         """Test successful media URL retrieval."""
         # Mock HTTP response
-        mock_http_client.get.return_value = {
-            "url": "https://example.com/media/file.jpg",
-            "mime_type": "image/jpeg",
-            "sha256": "hash123",
-            "file_size": 1024,
-            "id": "media_url_123"
-        }
+        mock_http_client.get.return_value = {**_MEDIA_META, "id": "media_url_123"}
 
         # Test get URL - returns string, not object
         url = media_service.get_url("media_url_123")
@@ -224,13 +288,7 @@ class TestMediaService:
     def test_download_success(self, media_service, mock_http_client):
         """Test successful media download to memory."""
         # Mock get URL response
-        mock_http_client.get.return_value = {
-            "url": "https://example.com/media/file.jpg",
-            "mime_type": "image/jpeg",
-            "sha256": "hash123",
-            "file_size": 1024,
-            "id": "media_dl_123"
-        }
+        mock_http_client.get.return_value = {**_MEDIA_META, "id": "media_dl_123"}
 
         # Mock download binary response
         mock_http_client.download_binary.return_value = b"fake_image_data"
@@ -245,6 +303,55 @@ class TestMediaService:
         mock_http_client.get.assert_called_once_with("media_dl_123")
         mock_http_client.download_binary.assert_called_once()
 
+    def test_download_url_cached(self, media_service, mock_http_client):
+        """Test back-to-back downloads fetch the media URL once."""
+        mock_http_client.get.return_value = {**_MEDIA_META, "id": "media_cache_123"}
+
+        media_service.download("media_cache_123")
+        media_service.download("media_cache_123")
+
+        mock_http_client.get.assert_called_once_with("media_cache_123")
+        assert mock_http_client.download_binary.call_count == 2
+
+    def test_download_url_cache_expires(self, media_service, mock_http_client, monkeypatch):
+        """Test the media URL is fetched again once the cached one is stale."""
+        mock_http_client.get.return_value = {**_MEDIA_META, "id": "media_ttl_123"}
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+        media_service.download("media_ttl_123")
+        now[0] += 241
+        media_service.download("media_ttl_123")
+
+        assert mock_http_client.get.call_count == 2
+
+    def test_download_url_cache_shared_between_threads(
+        self, media_service, mock_http_client, monkeypatch
+    ):
+        """Test concurrent lookups keep the URL cache bounded without errors."""
+        mock_http_client.get.return_value = {**_MEDIA_META, "id": "media_thread_123"}
+        monkeypatch.setattr(media, "_URL_CACHE_SIZE", 4)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            urls = list(pool.map(media_service._download_url, [f"m{i}" for i in range(200)]))
+
+        assert urls == [_MEDIA_META["url"]] * 200
+        assert len(media_service._url_cache) <= 4
+
+    def test_download_failure_drops_cached_url(self, media_service, mock_http_client):
+        """Test a failed download does not keep reusing the same URL."""
+        mock_http_client.get.return_value = {**_MEDIA_META, "id": "media_retry_123"}
+        mock_http_client.download_binary.side_effect = [
+            WhatsAppAPIError("Download failed: 404"),
+            b"fake_image_data",
+        ]
+
+        with pytest.raises(WhatsAppMediaError):
+            media_service.download("media_retry_123")
+        assert media_service.download("media_retry_123") == b"fake_image_data"
+
+        assert mock_http_client.get.call_count == 2
+
     def test_download_invalid_media_id(self, media_service, mock_http_client):
         """Test download with invalid media ID."""
         # Mock error response
@@ -256,13 +363,7 @@ class TestMediaService:
     def test_download_binary_failure(self, media_service, mock_http_client):
         """Test download failure during binary download."""
         # Mock get URL success
-        mock_http_client.get.return_value = {
-            "url": "https://example.com/media/file.jpg",
-            "mime_type": "image/jpeg",
-            "sha256": "hash123",
-            "file_size": 1024,
-            "id": "media_fail_123"
-        }
+        mock_http_client.get.return_value = {**_MEDIA_META, "id": "media_fail_123"}
 
         # Mock download binary failure
         mock_http_client.download_binary.side_effect = WhatsAppMediaError("Download failed")
@@ -270,79 +371,79 @@ class TestMediaService:
         with pytest.raises(WhatsAppMediaError, match="Download failed"):
             media_service.download("media_fail_123")
 
-    def test_download_to_file_success(self, media_service, mock_http_client):
+    def test_download_to_file_success(self, media_service, mock_http_client, tmp_path):
         """Test successful download to file."""
         # Mock get URL response
-        mock_http_client.get.return_value = {
-            "url": "https://example.com/media/file.jpg",
-            "mime_type": "image/jpeg",
-            "sha256": "hash123",
-            "file_size": 1024,
-            "id": "media_file_123"
-        }
+        mock_http_client.get.return_value = {**_MEDIA_META, "id": "media_file_123"}
 
-        # Mock download binary response
-        mock_http_client.download_binary.return_value = b"fake_image_data"
+        # Mock streamed download, delivered in two chunks
+        mock_http_client.stream_binary.return_value = iter([b"fake_image", b"_data"])
+        target = tmp_path / "image.jpg"
 
-        # Mock file operations
-        with patch("pathlib.Path.mkdir"), \
-             patch("builtins.open", mock_open()) as mock_file:
-            # Test download to file
-            result_path = media_service.download_to_file(
-                "media_file_123",
-                "/path/to/save/image.jpg"
-            )
+        # Test download to file
+        result_path = media_service.download_to_file("media_file_123", str(target))
 
-            # Verify result
-            assert result_path == "/path/to/save/image.jpg"
+        # Verify result; no partial file is left behind
+        assert result_path == str(target)
+        assert target.read_bytes() == b"fake_image_data"
+        assert [p.name for p in tmp_path.iterdir()] == ["image.jpg"]
 
-            # Verify file was written - MediaService uses Path internally
-            from pathlib import Path
-            mock_file.assert_called_once_with(Path("/path/to/save/image.jpg"), "wb")
-            mock_file().write.assert_called_once_with(b"fake_image_data")
-
-    def test_download_to_file_creates_directory(self, media_service, mock_http_client):
+    def test_download_to_file_creates_directory(self, media_service, mock_http_client, tmp_path):
         """Test download to file creates directory if needed."""
         # Mock get URL response
-        mock_http_client.get.return_value = {
-            "url": "https://example.com/media/file.jpg",
-            "mime_type": "image/jpeg",
-            "sha256": "hash123",
-            "file_size": 1024,
-            "id": "media_dir_123"
-        }
-        mock_http_client.download_binary.return_value = b"test_data"
+        mock_http_client.get.return_value = {**_MEDIA_META, "id": "media_dir_123"}
+        mock_http_client.stream_binary.return_value = iter([b"test_data"])
+        target = tmp_path / "new" / "directory" / "file.jpg"
 
-        with patch("pathlib.Path.mkdir") as mock_mkdir, \
-             patch("builtins.open", mock_open()), \
-             patch("pathlib.Path.exists", return_value=False):
-            # Test download to file with non-existent directory
-            media_service.download_to_file(
-                "media_dir_123",
-                "/new/directory/file.jpg"
-            )
+        # Test download to file with non-existent directory
+        media_service.download_to_file("media_dir_123", str(target))
 
-            # Verify directory was created
-            mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
+        # Verify directory was created
+        assert target.read_bytes() == b"test_data"
 
-    def test_download_to_file_permission_error(self, media_service, mock_http_client):
+    def test_download_to_file_permission_error(self, media_service, mock_http_client, monkeypatch):
         """Test download to file with permission error."""
         # Mock get URL response
-        mock_http_client.get.return_value = {
-            "url": "https://example.com/media/file.jpg",
-            "mime_type": "image/jpeg",
-            "sha256": "hash123",
-            "file_size": 1024,
-            "id": "media_perm_123"
-        }
-        mock_http_client.download_binary.return_value = b"test_data"
+        mock_http_client.get.return_value = {**_MEDIA_META, "id": "media_perm_123"}
+        mock_http_client.stream_binary.return_value = iter([b"test_data"])
 
         # Mock file permission error
-        with patch("pathlib.Path.mkdir"), \
-             patch("builtins.open", side_effect=PermissionError("Access denied")), \
-             pytest.raises(PermissionError, match="Access denied"):
+        monkeypatch.setattr(Path, "mkdir", lambda self, **kwargs: None)
+        monkeypatch.setattr("builtins.open", Mock(side_effect=PermissionError("Access denied")))
+
+        with pytest.raises(PermissionError, match="Access denied"):
             media_service.download_to_file("media_perm_123", "/protected/file.jpg")
 
+    def test_download_to_file_stream_failure(self, media_service, mock_http_client, tmp_path):
+        """Test streaming errors are raised as media errors and create no file."""
+        mock_http_client.get.return_value = {**_MEDIA_META, "id": "media_stream_123"}
+        mock_http_client.stream_binary.side_effect = WhatsAppAPIError("Download failed: 404")
+
+        with pytest.raises(WhatsAppMediaError, match="Download failed"):
+            media_service.download_to_file("media_stream_123", str(tmp_path / "file.jpg"))
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_download_to_file_failure_keeps_existing_file(
+        self, media_service, mock_http_client, tmp_path
+    ):
+        """Test a download failing midway leaves an existing file untouched."""
+
+        def stream(url):
+            yield b"partial"
+            raise WhatsAppAPIError("HTTP error: connection reset")
+
+        mock_http_client.get.return_value = {**_MEDIA_META, "id": "media_keep_123"}
+        mock_http_client.stream_binary.side_effect = stream
+        target = tmp_path / "file.jpg"
+        target.write_bytes(b"precious")
+
+        with pytest.raises(WhatsAppMediaError, match="Download failed"):
+            media_service.download_to_file("media_keep_123", str(target))
+
+        assert target.read_bytes() == b"precious"
+        assert [p.name for p in tmp_path.iterdir()] == ["file.jpg"]
+
     # ========================================================================
     # DELETE TESTS
     # ========================================================================
@@ -372,6 +473,12 @@ class TestMediaService:
         # Verify result
         assert result is False
 
+    def test_delete_without_success_field(self, media_service, mock_http_client):
+        """Test a response without a success flag counts as not deleted."""
+        mock_http_client.delete.return_value = {}
+
+        assert media_service.delete("media_del_empty") is False
+
     def test_delete_invalid_media_id(self, media_service, mock_http_client):
         """Test delete with invalid media ID."""
         # Mock error response
@@ -392,21 +499,11 @@ class TestMediaService:
     # VALIDATION TESTS
     # ========================================================================
 
-    def test_validate_file_size_all_media_types(self, media_service):
-        """Test file size validation for all media types."""
-        # Test within limits - correct parameter order (mime_type, file_size)
-        assert media_service._validate_file_size("image/jpeg", 1024) is None
-        assert media_service._validate_file_size("video/mp4", 1024) is None
-        assert media_service._validate_file_size("audio/mpeg", 1024) is None
-        assert media_service._validate_file_size("application/pdf", 1024) is None
-        assert media_service._validate_file_size("image/webp", 1024) is None
-
-        # Test at limits
-        assert media_service._validate_file_size("image/jpeg", 5 * 1024 * 1024) is None
-        assert media_service._validate_file_size("video/mp4", 16 * 1024 * 1024) is None
-        assert media_service._validate_file_size("audio/mpeg", 16 * 1024 * 1024) is None
-        assert media_service._validate_file_size("application/pdf", 100 * 1024 * 1024) is None
-        assert media_service._validate_file_size("image/webp", 512 * 1024) is None
+    @pytest.mark.parametrize("size", [1024, None], ids=["within", "at_limit"])
+    @pytest.mark.parametrize(("mime_type", "limit"), _SIZE_LIMIT_CASES)
+    def test_validate_file_size_all_media_types(self, media_service, mime_type, limit, size):
+        """Test file size validation accepts sizes up to each media type's limit."""
+        assert media_service._validate_file_size(mime_type, size or limit) is None
 
     def test_validate_file_size_unknown_mime_type(self, media_service):
         """Test file size validation for unknown MIME type."""
@@ -433,79 +530,36 @@ class TestMediaService:
     # INTEGRATION-LIKE TESTS
     # ========================================================================
 
-    def test_complete_upload_download_cycle(self, media_service, mock_http_client):
-        """Test complete upload and download cycle."""
-        # Test upload
-        with patch("pathlib.Path.exists", return_value=True), \
-             patch("pathlib.Path.stat") as mock_stat, \
-             patch("mimetypes.guess_type", return_value=("image/jpeg", None)), \
-             patch("builtins.open", mock_open(read_data=b"test_image")):
-            mock_stat.return_value.st_size = 1024
-            mock_http_client.upload_multipart.return_value = {"id": "cycle_123"}
-
-            upload_response = media_service.upload("/path/to/image.jpg")
-            assert upload_response.id == "cycle_123"
-
-        # Test download of uploaded media
-        mock_http_client.get.return_value = {
-            "url": "https://example.com/media/cycle_123",
-            "mime_type": "image/jpeg",
-            "sha256": "hash123",
-            "file_size": 1024,
-            "id": "cycle_123"
-        }
-        mock_http_client.download_binary.return_value = b"test_image"
-
-        downloaded_content = media_service.download("cycle_123")
-        assert downloaded_content == b"test_image"
-
     def test_service_configuration(self, media_service):
         """Test service is properly configured."""
         assert media_service.phone_number_id == "123456789"
         assert hasattr(media_service, "http_client")
         assert hasattr(media_service, "config")
 
-    def test_error_propagation_from_http_client(self, media_service, mock_http_client):
+    def test_error_propagation_from_http_client(self, media_service, mock_http_client, make_file):
         """Test that errors from HTTPClient are properly propagated."""
-        from whatsapp_sdk.exceptions import WhatsAppRateLimitError
-
         # Test rate limit error propagation
         mock_http_client.upload_multipart.side_effect = WhatsAppRateLimitError("Rate limit exceeded")
 
-        with patch("pathlib.Path.exists", return_value=True), \
-             patch("pathlib.Path.stat") as mock_stat, \
-             patch("mimetypes.guess_type", return_value=("image/jpeg", None)), \
-             patch("builtins.open", mock_open(read_data=b"test_image")):
-            mock_stat.return_value.st_size = 1024
+        path = make_file("image.jpg")
 
-            with pytest.raises(WhatsAppRateLimitError, match="Rate limit exceeded"):
-                media_service.upload("/path/to/image.jpg")
+        with pytest.raises(WhatsAppRateLimitError, match="Rate limit exceeded"):
+            media_service.upload(path)
 
-    def test_mime_type_detection_various_extensions(self, media_service, mock_http_client):
+    @pytest.mark.parametrize(("filename", "expected_mime_type"), _MIME_CASES)
+    def test_mime_type_detection_various_extensions(
+        self, media_service, mock_http_client, make_file, filename, expected_mime_type
+    ):
         """Test MIME type detection for various file extensions."""
-        test_cases = [
-            ("/path/to/file.jpg", "image/jpeg"),
-            ("/path/to/file.png", "image/png"),
-            ("/path/to/file.mp4", "video/mp4"),
-            ("/path/to/file.mp3", "audio/mpeg"),
-            ("/path/to/file.pdf", "application/pdf"),
-            ("/path/to/file.webp", "image/webp"),
-        ]
-
-        for file_path, expected_mime_type in test_cases:
-            with patch("pathlib.Path.exists", return_value=True), \
-                 patch("pathlib.Path.stat") as mock_stat, \
-                 patch("mimetypes.guess_type", return_value=(expected_mime_type, None)), \
-                 patch("builtins.open", mock_open(read_data=b"test_data")):
-                mock_stat.return_value.st_size = 1024
-                mock_http_client.upload_multipart.return_value = {"id": "test_123"}
+        path = make_file(filename)
+        mock_http_client.upload_multipart.return_value = {"id": "test_123"}
 
-                response = media_service.upload(file_path)
-                assert isinstance(response, MediaUploadResponse)
+        response = media_service.upload(path)
+        assert response.id == "test_123"
 
-                # Verify correct MIME type was used
-                call_args = mock_http_client.upload_multipart.call_args
-                assert call_args[1]["data"]["type"] == expected_mime_type
+        # Verify correct MIME type was used
+        call_args = mock_http_client.upload_multipart.call_args
+        assert call_args[1]["data"]["type"] == expected_mime_type
 
     def test_binary_data_handling(self, media_service, mock_http_client):
         """Test handling of binary data in uploads and downloads."""
@@ -530,23 +584,13 @@ class TestMediaService:
         downloaded = media_service.download("binary_123")
         assert downloaded == binary_data
 
-    def test_large_file_handling_simulation(self, media_service, mock_http_client):
+    @pytest.mark.parametrize(("mime_type", "file_size"), _SIZE_LIMIT_CASES)
+    def test_large_file_handling_simulation(
+        self, media_service, mock_http_client, make_file, mime_type, file_size
+    ):
         """Test handling of files at maximum allowed sizes."""
-        size_test_cases = [
-            ("image/jpeg", 5 * 1024 * 1024),      # 5MB image
-            ("video/mp4", 16 * 1024 * 1024),      # 16MB video
-            ("audio/mpeg", 16 * 1024 * 1024),     # 16MB audio
-            ("application/pdf", 100 * 1024 * 1024), # 100MB document
-            ("image/webp", 512 * 1024),           # 512KB sticker
-        ]
-
-        for mime_type, file_size in size_test_cases:
-            with patch("pathlib.Path.exists", return_value=True), \
-                 patch("pathlib.Path.stat") as mock_stat, \
-                 patch("mimetypes.guess_type", return_value=(mime_type, None)), \
-                 patch("builtins.open", mock_open(read_data=b"x" * file_size)):
-                mock_stat.return_value.st_size = file_size
+        path = make_file("large_file", file_size)
 
-                # Should succeed - just under limit
-                response = media_service.upload(f"/path/to/large_file.{mime_type.split('/')[-1]}")
-                assert isinstance(response, MediaUploadResponse)
+        # Should succeed - exactly at the limit
+        response = media_service.upload(path, mime_type=mime_type)
+        assert response.id == "media_123"
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import pytest
+from pydantic import ValidationError
 
 from whatsapp_sdk.models import (
     AudioMessage,
@@ -449,6 +450,18 @@ class TestMessagesService:
         assert "name" not in payload["location"]
         assert "address" not in payload["location"]
 
+    @pytest.mark.parametrize(
+        ("latitude", "longitude"), [(90.5, 0), (-91, 0), (0, 180.1), (0, -181)]
+    )
+    def test_send_location_out_of_range(
+        self, messages_service, mock_http_client, latitude, longitude
+    ):
+        """Test out-of-range coordinates are rejected before sending."""
+        with pytest.raises(ValidationError):
+            messages_service.send_location("+1234567890", latitude, longitude)
+
+        mock_http_client.post.assert_not_called()
+
     def test_send_location_with_name_only(self, messages_service, mock_http_client):
         """Test sending location with name but no address."""
         _ = messages_service.send_location(
@@ -0,0 +1,55 @@
+"""Tests for Templates Service."""
+
+from __future__ import annotations
+
+import pytest
+
+from whatsapp_sdk.models import TemplateResponse
+from whatsapp_sdk.services.templates import TemplatesService
+
+
+class TestTemplatesService:
+    """Test templates service functionality."""
+
+    @pytest.fixture()
+    def templates_service(self, mock_http_client, mock_config):
+        """Create templates service with mocked dependencies."""
+        return TemplatesService(
+            http_client=mock_http_client,
+            config=mock_config,
+            phone_number_id="123456789",
+        )
+
+    def test_create_strips_name(self, make_http_client, mock_config):
+        """Test template names are stripped and sent as given."""
+        mock_http_client = make_http_client(
+            get={"whatsapp_business_account": {"id": "waba_123"}},
+            post={"id": "tmpl_123", "status": "PENDING"},
+        )
+        templates_service = TemplatesService(
+            http_client=mock_http_client, config=mock_config, phone_number_id="123456789"
+        )
+
+        result = templates_service.create(
+            name=" order_update_2 ",
+            category="UTILITY",
+            language="en_US",
+            components=[{"type": "BODY", "text": "Your order shipped"}],
+        )
+
+        assert isinstance(result, TemplateResponse)
+        url = mock_http_client.post.call_args[0][0]
+        payload = mock_http_client.post.call_args[1]["json"]
+        assert url == "https://graph.facebook.com/waba_123/message_templates"
+        assert payload["name"] == "order_update_2"
+
+    @pytest.mark.parametrize(
+        "name", ["", "Order_Update", "order-update", "order update", "café", "x" * 513]
+    )
+    def test_create_invalid_name(self, templates_service, mock_http_client, name):
+        """Test invalid template names are rejected before any API call."""
+        with pytest.raises(ValueError, match="Invalid template name"):
+            templates_service.create(name=name, category="UTILITY", language="en_US", components=[])
+
+        mock_http_client.get.assert_not_called()
+        mock_http_client.post.assert_not_called()
@@ -0,0 +1,151 @@
+"""Tests for Webhooks Service."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import hmac
+
+import pytest
+from pydantic import ValidationError
+
+from whatsapp_sdk.config import WhatsAppConfig
+from whatsapp_sdk.exceptions import WhatsAppWebhookError
+from whatsapp_sdk.models import WebhookEvent
+from whatsapp_sdk.services.webhooks import WebhooksService
+
+
+class TestWebhooksService:
+    """Test webhooks service functionality."""
+
+    @pytest.fixture()
+    def webhooks_service(self, mock_config):
+        """Create WebhooksService instance with mocked configuration."""
+        return WebhooksService(config=mock_config)
+
+    @staticmethod
+    def _sign(payload: bytes, secret: str = "test_secret") -> str:
+        """Build an X-Hub-Signature-256 header value for a payload."""
+        digest = hmac.new(secret.encode("utf-8"), payload, hashlib.sha256).hexdigest()
+        return f"sha256={digest}"
+
+    # ========================================================================
+    # VERIFICATION TESTS
+    # ========================================================================
+
+    def test_verify_token_valid(self, webhooks_service):
+        """Test the configured verify token is accepted."""
+        assert webhooks_service.verify_token("verify_token") is True
+
+    @pytest.mark.parametrize("token", ["wrong_token", "", None])
+    def test_verify_token_invalid(self, webhooks_service, token):
+        """Test other tokens are rejected."""
+        assert webhooks_service.verify_token(token) is False
+
+    def test_verify_token_not_configured(self):
+        """Test token verification requires a configured verify token."""
+        service = WebhooksService(
+            config=WhatsAppConfig(phone_number_id="123456789", access_token="test_token")
+        )
+
+        with pytest.raises(WhatsAppWebhookError, match="Webhook verify token not configured"):
+            service.verify_token("verify_token")
+
+    # ========================================================================
+    # SIGNATURE TESTS
+    # ========================================================================
+
+    def test_verify_signature_valid(self, webhooks_service):
+        """Test a correctly signed payload is accepted."""
+        payload = b'{"object": "whatsapp_business_account"}'
+
+        assert webhooks_service.verify_signature(self._sign(payload), payload) is True
+
+    def test_verify_signature_uppercase_hex(self, webhooks_service):
+        """Test hex digests are compared case-insensitively."""
+        payload = b'{"object": "whatsapp_business_account"}'
+        signature = "sha256=" + self._sign(payload)[7:].upper()
+
+        assert webhooks_service.verify_signature(signature, payload) is True
+
+    def test_verify_signature_wrong_secret(self, webhooks_service):
+        """Test a payload signed with another secret is rejected."""
+        payload = b'{"object": "whatsapp_business_account"}'
+
+        assert webhooks_service.verify_signature(self._sign(payload, "other"), payload) is False
+
+    def test_verify_signature_tampered_payload(self, webhooks_service):
+        """Test a modified payload no longer matches its signature."""
+        signature = self._sign(b'{"object": "whatsapp_business_account"}')
+
+        assert webhooks_service.verify_signature(signature, b'{"object": "tampered"}') is False
+
+    @pytest.mark.parametrize(
+        "signature",
+        [
+            "",
+            "sha1=abcdef",
+            "sha256=not-hex",
+            "sha256=abcd",
+            "sha256=" + "00" * 33,
+        ],
+    )
+    def test_verify_signature_malformed(self, webhooks_service, signature):
+        """Test malformed signature headers are rejected without raising."""
+        assert webhooks_service.verify_signature(signature, b"{}") is False
+
+    def test_verify_signature_without_app_secret(self):
+        """Test signature verification requires an app secret."""
+        service = WebhooksService(
+            config=WhatsAppConfig(phone_number_id="123456789", access_token="test_token")
+        )
+
+        with pytest.raises(WhatsAppWebhookError, match="App secret not configured"):
+            service.verify_signature("sha256=00", b"{}")
+
+    # ========================================================================
+    # EVENT HANDLING TESTS
+    # ========================================================================
+
+    def test_handle_event(self, webhooks_service, sample_webhook_payload_bytes):
+        """Test a signed payload is parsed into a WebhookEvent."""
+        payload = sample_webhook_payload_bytes
+
+        event = webhooks_service.handle_event(self._sign(payload), payload)
+
+        assert isinstance(event, WebhookEvent)
+        messages = webhooks_service.extract_messages(event)
+        assert messages[0].text.body == "Hello!"
+
+    def test_handle_event_invalid_signature(self, webhooks_service):
+        """Test an unsigned payload is rejected."""
+        with pytest.raises(WhatsAppWebhookError, match="Invalid webhook signature"):
+            webhooks_service.handle_event("sha256=00", b"{}")
+
+    def test_handle_event_invalid_json(self, webhooks_service):
+        """Test a signed non-JSON payload raises a webhook error."""
+        payload = b"not json"
+
+        with pytest.raises(WhatsAppWebhookError, match="Invalid JSON payload"):
+            webhooks_service.handle_event(self._sign(payload), payload)
+
+    def test_handle_event_invalid_event(self, webhooks_service):
+        """Test a signed JSON payload missing fields fails validation."""
+        payload = b'{"object": "whatsapp_business_account"}'
+
+        with pytest.raises(ValidationError):
+            webhooks_service.handle_event(self._sign(payload), payload)
+
+    def test_extract_statuses(self, webhooks_service, sample_webhook_payload_mutable):
+        """Test statuses are collected across entries and empty values are skipped."""
+        payload = sample_webhook_payload_mutable
+        entry = copy.deepcopy(payload["entry"][0])
+        entry["changes"][0]["value"]["statuses"] = [
+            {"id": "wamid.1", "status": "read", "timestamp": "1", "recipient_id": "1"}
+        ]
+        payload["entry"].append(entry)
+
+        event = webhooks_service.parse_event(payload)
+
+        assert [s.id for s in webhooks_service.extract_statuses(event)] == ["wamid.1"]
+        assert len(webhooks_service.extract_messages(event)) == 2
@@ -3,57 +3,70 @@
 
 from __future__ import annotations
 
+import httpx
 import pytest
 
-from whatsapp_sdk import WhatsAppClient, WhatsAppConfig
+from whatsapp_sdk import WhatsAppClient
+
+# Config values a client gets when only the required parameters are given
+_CONFIG_DEFAULTS = {
+    "app_secret": None,
+    "webhook_verify_token": None,
+    "base_url": "https://graph.facebook.com",
+    "api_version": "v23.0",
+    "timeout": 30,
+    "max_retries": 3,
+    "rate_limit": 80,
+}
+
+
+@pytest.fixture(scope="module")
+def httpx_client():
+    """Share one connection pool across the client constructions below."""
+    with httpx.Client() as client:
+        yield client
 
 
 class TestWhatsAppClient:
     """Test WhatsApp client initialization and configuration."""
 
-    def test_client_initialization(self):
-        """Test client initialization with required parameters."""
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {
+                "app_secret": "secret",  # nosec B105  # Test secret for unit tests
+                "webhook_verify_token": "verify",  # nosec B105  # Test token for unit tests
+                "base_url": "https://custom.api.com",
+                "api_version": "v20.0",
+                "timeout": 60,
+                "max_retries": 5,
+                "rate_limit": 100,
+            },
+        ],
+        ids=["required_only", "all_parameters"],
+    )
+    def test_client_initialization(self, httpx_client, kwargs):
+        """Test client initialization with required and optional parameters."""
         client = WhatsAppClient(
             phone_number_id="123456789",
             access_token="test_token",
+            httpx_client=httpx_client,
+            **kwargs,
         )
 
+        expected = {**_CONFIG_DEFAULTS, **kwargs}
         assert client.phone_number_id == "123456789"
         assert client.config.access_token == "test_token"
-        assert client.config.base_url == "https://graph.facebook.com"
-        assert client.config.api_version == "v23.0"
-
-    def test_client_with_all_parameters(self):
-        """Test client initialization with all parameters."""
-        app_secret = "secret"  # nosec B105  # Test secret for unit tests
-        verify_token = "verify"  # nosec B105  # Test token for unit tests
-        client = WhatsAppClient(
-            phone_number_id="123456789",
-            access_token="test_token",
-            app_secret=app_secret,
-            webhook_verify_token=verify_token,
-            base_url="https://custom.api.com",
-            api_version="v20.0",
-            timeout=60,
-            max_retries=5,
-            rate_limit=100,
-        )
+        for name, value in expected.items():
+            assert getattr(client.config, name) == value
 
-        assert client.phone_number_id == "123456789"
-        assert client.config.access_token == "test_token"
-        assert client.config.app_secret == app_secret
-        assert client.config.webhook_verify_token == verify_token
-        assert client.config.base_url == "https://custom.api.com"
-        assert client.config.api_version == "v20.0"
-        assert client.config.timeout == 60
-        assert client.config.max_retries == 5
-        assert client.config.rate_limit == 100
-
-    def test_client_services_initialization(self):
+    def test_client_services_initialization(self, httpx_client):
         """Test that all services are properly initialized."""
         client = WhatsAppClient(
             phone_number_id="123456789",
             access_token="test_token",
+            httpx_client=httpx_client,
         )
 
         assert hasattr(client, "messages")
@@ -61,6 +74,69 @@ class TestWhatsAppClient:
         assert hasattr(client, "media")
         assert hasattr(client, "webhooks")
 
+    def test_client_with_shared_httpx_client(self):
+        """Test clients can share one httpx client."""
+        shared = httpx.Client()
+        first = WhatsAppClient(phone_number_id="1", access_token="token_a", httpx_client=shared)
+        second = WhatsAppClient(phone_number_id="2", access_token="token_b", httpx_client=shared)
+
+        assert first.http_client.client is shared
+        assert second.http_client.client is shared
+        shared.close()
+
+    def test_client_with_injected_http_client(self, mock_http_client):
+        """Test a pre-built HTTP client is used as-is."""
+        client = WhatsAppClient(
+            phone_number_id="123456789", access_token="test_token", http_client=mock_http_client
+        )
+
+        assert client.http_client is mock_http_client
+        assert client.messages.http_client is mock_http_client
+        assert client.config is mock_http_client.config
+
+    def test_client_settings_from_injected_http_client(self, mock_http_client):
+        """Test an injected HTTP client supplies the phone number ID and secrets."""
+        client = WhatsAppClient(http_client=mock_http_client)
+
+        assert client.phone_number_id == mock_http_client.config.phone_number_id
+        assert client.messages.phone_number_id == mock_http_client.config.phone_number_id
+        assert client.webhooks.verify_token("verify_token")
+
+    @pytest.mark.parametrize(
+        "name", ["phone_number_id", "access_token", "app_secret", "webhook_verify_token"]
+    )
+    def test_client_rejects_mismatched_settings(self, mock_http_client, name):
+        """Test explicit credentials must match the injected HTTP client's config."""
+        with pytest.raises(ValueError, match=f"{name} does not match"):
+            WhatsAppClient(http_client=mock_http_client, **{name: "other"})
+
+    def test_client_requires_credentials(self):
+        """Test phone number ID and access token are required without http_client."""
+        with pytest.raises(ValueError, match="required"):
+            WhatsAppClient(phone_number_id="123456789")
+
+    def test_client_rejects_non_http_client(self):
+        """Test an injected HTTP client must be an HTTPClient."""
+        with pytest.raises(TypeError, match="HTTPClient"):
+            WhatsAppClient(
+                phone_number_id="123456789", access_token="test_token", http_client=object()
+            )
+
+    def test_client_httpx_client_is_keyword_only(self):
+        """Test httpx_client cannot be passed positionally."""
+        with httpx.Client() as shared, pytest.raises(TypeError):
+            WhatsAppClient("123456789", "test_token", None, None, "url", "v23.0", 30, 3, 80, shared)
+
+    def test_client_rejects_both_http_clients(self, mock_http_client):
+        """Test httpx_client and http_client cannot be combined."""
+        with httpx.Client() as shared, pytest.raises(ValueError, match="not both"):
+            WhatsAppClient(
+                phone_number_id="123456789",
+                access_token="test_token",
+                httpx_client=shared,
+                http_client=mock_http_client,
+            )
+
     def test_from_env_success(self, mock_env):
         """Test creating client from environment variables."""
         client = WhatsAppClient.from_env()
@@ -99,46 +175,3 @@ class TestWhatsAppClient:
         assert client.config.timeout == 45
         assert client.config.max_retries == 10
         assert client.config.rate_limit == 200
-
-
-class TestWhatsAppConfig:
-    """Test WhatsApp configuration."""
-
-    def test_config_initialization(self):
-        """Test configuration with required parameters."""
-        config = WhatsAppConfig(
-            phone_number_id="123456789",
-            access_token="test_token",
-        )
-
-        assert config.phone_number_id == "123456789"
-        assert config.access_token == "test_token"
-        assert config.base_url == "https://graph.facebook.com"
-        assert config.api_version == "v23.0"
-        assert config.timeout == 30
-        assert config.max_retries == 3
-        assert config.rate_limit == 80
-
-    def test_config_with_all_parameters(self):
-        """Test configuration with all parameters."""
-        config = WhatsAppConfig(
-            phone_number_id="123456789",
-            access_token="test_token",
-            app_secret="secret",
-            webhook_verify_token="verify",
-            base_url="https://custom.api.com",
-            api_version="v20.0",
-            timeout=60,
-            max_retries=5,
-            rate_limit=100,
-        )
-
-        assert config.phone_number_id == "123456789"
-        assert config.access_token == "test_token"
-        assert config.app_secret == "secret"
-        assert config.webhook_verify_token == "verify"
-        assert config.base_url == "https://custom.api.com"
-        assert config.api_version == "v20.0"
-        assert config.timeout == 60
-        assert config.max_retries == 5
-        assert config.rate_limit == 100
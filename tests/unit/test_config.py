@@ -0,0 +1,65 @@
+"""Tests for WhatsApp configuration."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from whatsapp_sdk import WhatsAppConfig
+
+
+class TestWhatsAppConfig:
+    """Test WhatsApp configuration."""
+
+    def test_config_initialization(self):
+        """Test configuration with required parameters."""
+        config = WhatsAppConfig(
+            phone_number_id="123456789",
+            access_token="test_token",
+        )
+
+        assert config.phone_number_id == "123456789"
+        assert config.access_token == "test_token"
+        assert config.base_url == "https://graph.facebook.com"
+        assert config.api_version == "v23.0"
+        assert config.timeout == 30
+        assert config.max_retries == 3
+        assert config.rate_limit == 80
+
+    def test_config_with_all_parameters(self):
+        """Test configuration with all parameters."""
+        config = WhatsAppConfig(
+            phone_number_id="123456789",
+            access_token="test_token",
+            app_secret="secret",
+            webhook_verify_token="verify",
+            base_url="https://custom.api.com",
+            api_version="v20.0",
+            timeout=60,
+            max_retries=5,
+            rate_limit=100,
+        )
+
+        assert config.phone_number_id == "123456789"
+        assert config.access_token == "test_token"
+        assert config.app_secret == "secret"
+        assert config.webhook_verify_token == "verify"
+        assert config.base_url == "https://custom.api.com"
+        assert config.api_version == "v20.0"
+        assert config.timeout == 60
+        assert config.max_retries == 5
+        assert config.rate_limit == 100
+
+    def test_config_is_frozen(self):
+        """Test configuration cannot be modified after creation."""
+        config = WhatsAppConfig(phone_number_id="123456789", access_token="test_token")
+
+        with pytest.raises(ValidationError):
+            config.access_token = "other_token"
+
+    def test_config_strips_whitespace(self):
+        """Test string settings are stripped of surrounding whitespace."""
+        config = WhatsAppConfig(phone_number_id=" 123456789 ", access_token="test_token\n")
+
+        assert config.phone_number_id == "123456789"
+        assert config.access_token == "test_token"
@@ -0,0 +1,397 @@
+"""Tests for HTTP client."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from whatsapp_sdk import http_client as http_client_module
+from whatsapp_sdk.config import WhatsAppConfig
+from whatsapp_sdk.exceptions import (
+    WhatsAppAPIError,
+    WhatsAppAuthenticationError,
+    WhatsAppError,
+    WhatsAppRateLimitError,
+    WhatsAppValidationError,
+)
+from whatsapp_sdk.http_client import HTTPClient
+
+
+class TestRateLimit:
+    """Test token bucket rate limiting."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record sleep calls instead of sleeping."""
+        calls = []
+        monkeypatch.setattr("whatsapp_sdk.http_client.time.sleep", calls.append)
+        return calls
+
+    @pytest.fixture
+    def http_client(self):
+        """Create HTTP client with a small rate limit."""
+        config = WhatsAppConfig(
+            phone_number_id="123456789", access_token="test_token", rate_limit=5
+        )
+        client = HTTPClient(config)
+        yield client
+        client.close()
+
+    def test_burst_does_not_sleep(self, http_client, sleeps):
+        """Test requests within the limit proceed immediately."""
+        for _ in range(5):
+            http_client._apply_rate_limit()
+
+        assert sleeps == []
+
+    def test_empty_bucket_sleeps(self, http_client, sleeps, monkeypatch):
+        """Test an exhausted bucket waits for the next token."""
+        monkeypatch.setattr("whatsapp_sdk.http_client.time.monotonic", lambda: 100.0)
+        http_client._last_refill = 100.0
+        http_client._tokens = 0.0
+
+        http_client._apply_rate_limit()
+
+        assert sleeps == [pytest.approx(0.2)]
+
+
+class TestRequestHeaders:
+    """Test headers sent with requests."""
+
+    @pytest.fixture
+    def http_client(self):
+        """Create HTTP client that records outgoing requests."""
+        config = WhatsAppConfig(phone_number_id="123456789", access_token="test_token")
+        client = HTTPClient(config)
+        client.requests = []
+
+        def handler(request):
+            client.requests.append(request)
+            return httpx.Response(200, json={"id": "media_123"})
+
+        client.client._transport = httpx.MockTransport(handler)
+        yield client
+        client.close()
+
+    def test_json_request_headers(self, http_client):
+        """Test JSON requests carry auth and JSON content type."""
+        http_client.post("123/messages", json={"to": "1234567890"})
+
+        request = http_client.requests[0]
+        assert request.headers["Authorization"] == "Bearer test_token"
+        assert request.headers["Content-Type"] == "application/json"
+
+    @pytest.mark.parametrize("headers", [None, {"X-Request-Id": "abc"}], ids=["none", "extra"])
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_json_post_encoders(self, http_client, monkeypatch, use_orjson, headers):
+        """Test JSON posts encode the same with and without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(http_client_module, "orjson", None)
+
+        http_client.post("123/messages", json={"to": "1234567890"}, headers=headers)
+
+        request = http_client.requests[0]
+        assert json.loads(request.content) == {"to": "1234567890"}
+        assert request.headers["Content-Type"] == "application/json"
+        assert request.headers["Authorization"] == "Bearer test_token"
+        for name, value in (headers or {}).items():
+            assert request.headers[name] == value
+
+    def test_multipart_request_headers(self, http_client):
+        """Test uploads are sent as multipart with a boundary."""
+        http_client.upload_multipart(
+            "123/media",
+            files={"file": ("test.jpg", b"data", "image/jpeg")},
+            data={"messaging_product": "whatsapp"},
+        )
+
+        request = http_client.requests[0]
+        assert request.headers["Authorization"] == "Bearer test_token"
+        assert request.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+
+
+class TestHandleResponse:
+    """Test response status handling."""
+
+    @pytest.fixture
+    def http_client(self):
+        """Create HTTP client."""
+        config = WhatsAppConfig(phone_number_id="123456789", access_token="test_token")
+        client = HTTPClient(config)
+        yield client
+        client.close()
+
+    def test_success(self, http_client):
+        """Test successful JSON response is returned."""
+        response = httpx.Response(200, json={"id": "123"})
+
+        assert http_client._handle_response(response) == {"id": "123"}
+
+    def test_no_content(self, http_client):
+        """Test 204 response is reported as success."""
+        assert http_client._handle_response(httpx.Response(204)) == {"success": True}
+
+    def test_invalid_json(self, http_client):
+        """Test non-JSON success body raises API error."""
+        with pytest.raises(WhatsAppAPIError, match="Invalid JSON response"):
+            http_client._handle_response(httpx.Response(200, content=b"not json"))
+
+    @pytest.mark.parametrize(
+        ("response", "error", "message"),
+        [
+            (httpx.Response(429), WhatsAppRateLimitError, "Rate limit exceeded"),
+            (httpx.Response(401), WhatsAppAuthenticationError, "Invalid access token"),
+            (
+                httpx.Response(400, json={"error": {"message": "Invalid parameter"}}),
+                WhatsAppValidationError,
+                "Invalid parameter",
+            ),
+            (httpx.Response(400, content=b"oops"), WhatsAppValidationError, "Bad request"),
+            (
+                httpx.Response(500, json={"error": {"message": "Server error", "code": 1}}),
+                WhatsAppAPIError,
+                "Error 1: Server error",
+            ),
+            (httpx.Response(503, content=b""), WhatsAppAPIError, "HTTP 503"),
+        ],
+    )
+    def test_errors(self, http_client, response, error, message):
+        """Test error responses map to SDK exceptions."""
+        with pytest.raises(error, match=message):
+            http_client._handle_response(response)
+
+
+class TestRetries:
+    """Test request retry behavior."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record sleep calls instead of sleeping, with jitter disabled."""
+        calls = []
+        monkeypatch.setattr("whatsapp_sdk.http_client.time.sleep", calls.append)
+        monkeypatch.setattr("whatsapp_sdk.http_client.random.random", lambda: 1.0)
+        return calls
+
+    @pytest.fixture
+    def make_client(self):
+        """Create HTTP clients whose transport replays the given outcomes."""
+        clients = []
+
+        def _make(*outcomes):
+            config = WhatsAppConfig(
+                phone_number_id="123456789", access_token="test_token", max_retries=2
+            )
+            client = HTTPClient(config)
+            client.calls = 0
+            remaining = list(outcomes)
+
+            def handler(request):
+                client.calls += 1
+                outcome = remaining.pop(0)
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
+
+            client.client._transport = httpx.MockTransport(handler)
+            clients.append(client)
+            return client
+
+        yield _make
+        for client in clients:
+            client.close()
+
+    def test_retries_server_error(self, make_client, sleeps):
+        """Test 5xx responses are retried until success."""
+        client = make_client(httpx.Response(500), httpx.Response(200, json={"id": "123"}))
+
+        assert client.get("123") == {"id": "123"}
+        assert client.calls == 2
+        assert sleeps == [0.5]
+
+    def test_retries_rate_limit_with_backoff(self, make_client, sleeps):
+        """Test 429 responses back off exponentially and then raise."""
+        client = make_client(httpx.Response(429), httpx.Response(429), httpx.Response(429))
+
+        with pytest.raises(WhatsAppRateLimitError):
+            client.post("123/messages", json={})
+        assert client.calls == 3
+        assert sleeps == [0.5, 1.0]
+
+    def test_retries_network_error(self, make_client, sleeps):
+        """Test network failures are retried and then wrapped."""
+        error = httpx.ConnectError("boom")
+        client = make_client(error, error, error)
+
+        with pytest.raises(WhatsAppAPIError, match="HTTP error: boom"):
+            client.delete("123")
+        assert client.calls == 3
+
+    def test_backoff_is_capped(self, make_client, sleeps):
+        """Test backoff delays never exceed the cap."""
+        client = make_client(*[httpx.Response(503)] * 7)
+        client._max_retries = 6
+
+        with pytest.raises(WhatsAppAPIError):
+            client.get("123")
+        assert sleeps == [0.5, 1.0, 2.0, 4.0, 8.0, 8.0]
+
+    @pytest.mark.parametrize("status", [400, 401, 404])
+    def test_client_errors_not_retried(self, make_client, sleeps, status):
+        """Test client errors are raised without retrying."""
+        client = make_client(httpx.Response(status))
+
+        with pytest.raises(WhatsAppError):
+            client.get("123")
+        assert client.calls == 1
+        assert sleeps == []
+
+
+class TestStreamBinary:
+    """Test streamed binary downloads."""
+
+    @pytest.fixture()
+    def make_client(self):
+        """Create HTTP clients whose transport calls the given handler."""
+
+        def _make(handler):
+            config = WhatsAppConfig(phone_number_id="123456789", access_token="test_token")
+            client = HTTPClient(config)
+            client.client._transport = httpx.MockTransport(handler)
+            return client
+
+        return _make
+
+    def test_yields_chunks(self, make_client):
+        """Test the body is yielded in chunks of at most chunk_size bytes."""
+        client = make_client(lambda request: httpx.Response(200, content=b"abcdefgh"))
+
+        chunks = list(client.stream_binary("https://example.com/media", chunk_size=3))
+
+        assert chunks == [b"abc", b"def", b"gh"]
+
+    def test_sends_auth_header(self, make_client):
+        """Test streamed downloads are authenticated."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=b"data")
+
+        list(make_client(handler).stream_binary("https://example.com/media"))
+
+        assert requests[0].headers["Authorization"] == "Bearer test_token"
+
+    def test_error_status(self, make_client):
+        """Test client errors raise before any chunk is yielded, without retrying."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404)
+
+        with pytest.raises(WhatsAppAPIError, match="HTTP 404"):
+            list(make_client(handler).stream_binary("https://example.com/media"))
+        assert len(calls) == 1
+
+    def test_retries_before_first_chunk(self, make_client, monkeypatch):
+        """Test server errors and network failures are retried before streaming."""
+        monkeypatch.setattr("whatsapp_sdk.http_client.time.sleep", lambda seconds: None)
+        outcomes = [
+            httpx.ConnectError("boom"),
+            httpx.Response(503),
+            httpx.Response(200, content=b"ok"),
+        ]
+
+        def handler(request):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        assert list(make_client(handler).stream_binary("https://example.com/media")) == [b"ok"]
+        assert outcomes == []
+
+    def test_rate_limit_exhausted(self, make_client, monkeypatch):
+        """Test an exhausted rate limit raises WhatsAppRateLimitError."""
+        monkeypatch.setattr("whatsapp_sdk.http_client.time.sleep", lambda seconds: None)
+        client = make_client(lambda request: httpx.Response(429))
+
+        with pytest.raises(WhatsAppRateLimitError):
+            list(client.stream_binary("https://example.com/media"))
+
+    def test_network_error(self, make_client, monkeypatch):
+        """Test network failures are raised as API errors once retries run out."""
+        monkeypatch.setattr("whatsapp_sdk.http_client.time.sleep", lambda seconds: None)
+
+        def handler(request):
+            raise httpx.ConnectError("boom")
+
+        with pytest.raises(WhatsAppAPIError, match="HTTP error"):
+            list(make_client(handler).stream_binary("https://example.com/media"))
+
+    def test_mid_stream_failure_not_retried(self, make_client):
+        """Test a failure after the first chunk is raised without retrying."""
+        calls = []
+
+        class _BrokenStream(httpx.SyncByteStream):
+            def __iter__(self):
+                yield b"ab"
+                raise httpx.ReadError("connection reset")
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, stream=_BrokenStream())
+
+        chunks = []
+        with pytest.raises(WhatsAppAPIError, match="connection reset"):
+            for chunk in make_client(handler).stream_binary("https://example.com/media", 2):
+                chunks.append(chunk)
+        assert chunks == [b"ab"]
+        assert len(calls) == 1
+
+
+class TestSharedClient:
+    """Test sharing an httpx client between SDK clients."""
+
+    def test_shared_client_sends_each_token(self):
+        """Test each SDK client authenticates with its own token."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={})
+
+        shared = httpx.Client(transport=httpx.MockTransport(handler))
+        for token in ("token_a", "token_b"):
+            config = WhatsAppConfig(phone_number_id="123456789", access_token=token)
+            HTTPClient(config, client=shared).get("123")
+
+        assert [r.headers["Authorization"] for r in requests] == [
+            "Bearer token_a",
+            "Bearer token_b",
+        ]
+        shared.close()
+
+    def test_shared_client_not_closed(self):
+        """Test closing the SDK client leaves a shared client open."""
+        shared = httpx.Client()
+        config = WhatsAppConfig(phone_number_id="123456789", access_token="test_token")
+
+        with HTTPClient(config, client=shared):
+            pass
+
+        assert not shared.is_closed
+        shared.close()
+
+    def test_owned_client_closed(self):
+        """Test closing the SDK client closes the client it created."""
+        config = WhatsAppConfig(phone_number_id="123456789", access_token="test_token")
+        http_client = HTTPClient(config)
+
+        http_client.close()
+
+        assert http_client.client.is_closed
@@ -0,0 +1,51 @@
+"""Tests for package-level imports."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import whatsapp_sdk
+from whatsapp_sdk.client import WhatsAppClient
+from whatsapp_sdk.models import WebhookEvent
+
+
+class TestPackageImports:
+    """Test lazy imports from the package root."""
+
+    def test_exceptions_do_not_import_dependencies(self):
+        """Test importing the package does not load httpx or pydantic."""
+        code = (
+            "import sys\n"
+            "from whatsapp_sdk import WhatsAppError\n"
+            "assert 'httpx' not in sys.modules\n"
+            "assert 'pydantic' not in sys.modules\n"
+        )
+        # Pass our sys.path so the child finds the package without an install
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+    def test_lazy_attributes_resolve(self):
+        """Test lazily imported names resolve to the real classes."""
+        assert whatsapp_sdk.WhatsAppClient is WhatsAppClient
+        assert whatsapp_sdk.WebhookEvent is WebhookEvent
+        assert set(whatsapp_sdk.__all__) <= set(dir(whatsapp_sdk))
+
+    def test_submodules_resolve_as_attributes(self):
+        """Test submodules are reachable from a bare package import."""
+        code = (
+            "import whatsapp_sdk\n"
+            "assert whatsapp_sdk.models.TextMessage\n"
+            "assert whatsapp_sdk.services.MessagesService\n"
+            "assert whatsapp_sdk.client.WhatsAppClient\n"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+    def test_unknown_attribute(self):
+        """Test unknown names raise AttributeError."""
+        with pytest.raises(AttributeError):
+            whatsapp_sdk.NotAThing  # noqa: B018